@@ -72,6 +72,7 @@ a = Analysis(
         'playwright.sync_api',
         'beautifulsoup4',
         'bs4',
+        'lxml',
         'customtkinter',
         'slugify',
         'PIL',
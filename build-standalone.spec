@@ -50,6 +50,7 @@ a = Analysis(
         'playwright.sync_api',
         'beautifulsoup4',
         'bs4',
+        'lxml',
         'customtkinter',
         'slugify',
         'PIL',
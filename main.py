@@ -4,11 +4,12 @@ import sys
 import os
 import logging
 
-# Ensure src is importable
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Directory containing this script. __file__ is already absolute for the
+# __main__ module on Python 3.9+, so no abspath()/getcwd() round-trip is needed.
+APP_DIR = os.path.dirname(__file__) or os.curdir
 
-from src.config import load_config, save_config
-from src.ui.app import App
+# Ensure src is importable
+sys.path.insert(0, APP_DIR)
 
 
 def setup_logging():
@@ -22,8 +23,14 @@ def setup_logging():
 
 def main():
     setup_logging()
-    config = load_config()
-    save_config(config)  # Ensure config file exists with defaults
+
+    # Imported here so the GUI stack (tkinter, customtkinter, playwright) is
+    # only loaded when the application actually starts
+    from src.config import load_config, save_config, get_config_path
+    from src.ui.app import App
+
+    if not os.path.exists(get_config_path()):
+        save_config(load_config())  # Create config file with defaults on first run
 
     app = App()
     app.mainloop()
@@ -21,28 +21,89 @@ Usage:
   python3 scripts/create_releases.py --skip-push
   # Specify different repository
   python3 scripts/create_releases.py --owner=myuser --repo=myrepo
+
+  # Limit concurrent GitHub API requests when creating releases
+  python3 scripts/create_releases.py --workers=2
 """
 
+from __future__ import annotations
+
+import configparser
+import functools
+import json
+import mmap
 import re
 import subprocess
 import sys
-from typing import List, Tuple
-import requests
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Set, Tuple
 import os
 import textwrap
 
+if TYPE_CHECKING:
+    # Imported lazily by the functions that talk to GitHub; parsing,
+    # tagging and --help do not pay for loading requests/urllib3.
+    import requests
+
 # Constants
 MAX_TAG_MESSAGE_LENGTH = 200  # Maximum length of changelog text included in a tag message before truncation
+DEFAULT_RELEASE_WORKERS = 4  # Concurrent GitHub API requests when creating releases
+MAX_RATE_LIMIT_WAIT = 60  # Upper bound (seconds) for a single rate-limit back-off
+
+# Version section header: ## [X.Y.Z] - YYYY-MM-DD (ASCII digits only, like the
+# fast tokenizer in _split_version_header)
+_VERSION_RE = re.compile(r'## \[(\d+\.\d+\.\d+)\] - (\d{4}-\d{2}-\d{2})', re.ASCII)
+# Literal prefix shared by every version header, used to locate candidates cheaply
+_VERSION_PREFIX = b'## ['
+# Header that terminates the release notes part of the changelog
+_END_MARKER = b'## AI Agent Instructions'
+
+
+def _owner_repo_from_url(url: str) -> Optional[Tuple[str, str]]:
+    """Extract (owner, repo) from a GitHub SSH or HTTPS remote URL."""
+    # Handle SSH URLs: git@github.com:owner/repo.git
+    if url.startswith("git@github.com:"):
+        path = url.split("git@github.com:", 1)[1]
+    # Handle HTTPS URLs: https://github.com/owner/repo.git
+    elif "github.com/" in url:
+        path = url.split("github.com/", 1)[1]
+    else:
+        path = ""
+
+    if path:
+        if path.endswith(".git"):
+            path = path[:-4]
+        if "/" in path:
+            owner, repo = path.split("/", 1)
+            if owner and repo:
+                return owner, repo
+    return None
 
 
+def _read_origin_url_from_git_config() -> Optional[str]:
+    """Read remote.origin.url straight from .git/config, without spawning git."""
+    parser = configparser.ConfigParser(strict=False, interpolation=None)
+    try:
+        if not parser.read(os.path.join(".git", "config"), encoding="utf-8"):
+            return None
+        return parser.get('remote "origin"', "url", fallback=None)
+    except (configparser.Error, UnicodeDecodeError):
+        return None
+
+
+@functools.lru_cache(maxsize=1)
 def _get_default_owner_repo() -> Tuple[str, str]:
     """
     Determine the default GitHub owner and repository.
 
     Preference order:
       1. GITHUB_REPOSITORY environment variable (owner/repo)
-      2. Git remote.origin.url
+      2. remote.origin.url, read from .git/config directly or via ``git config``
       3. Hard-coded fallback (original behavior)
+
+    The result is memoized for the lifetime of the process.
     """
     # 1. Try GitHub Actions environment variable
     github_repo = os.getenv("GITHUB_REPOSITORY")
@@ -51,32 +112,23 @@ def _get_default_owner_repo() -> Tuple[str, str]:
         if owner and repo:
             return owner, repo
 
-    # 2. Try git remote.origin.url
+    # 2a. Parse .git/config directly (no subprocess)
+    url = _read_origin_url_from_git_config()
+    if url:
+        owner_repo = _owner_repo_from_url(url.strip())
+        if owner_repo:
+            return owner_repo
+
+    # 2b. Ask git (handles worktrees, includes and other config layouts)
     try:
         result = subprocess.run(
             ["git", "config", "--get", "remote.origin.url"],
             capture_output=True,
-            text=True,
             check=True,
         )
-        url = result.stdout.strip()
-
-        # Handle SSH URLs: git@github.com:owner/repo.git
-        if url.startswith("git@github.com:"):
-            path = url.split("git@github.com:", 1)[1]
-        # Handle HTTPS URLs: https://github.com/owner/repo.git
-        elif "github.com/" in url:
-            path = url.split("github.com/", 1)[1]
-        else:
-            path = ""
-
-        if path:
-            if path.endswith(".git"):
-                path = path[:-4]
-            if "/" in path:
-                owner, repo = path.split("/", 1)
-                if owner and repo:
-                    return owner, repo
+        owner_repo = _owner_repo_from_url(result.stdout.strip().decode('utf-8', errors='replace'))
+        if owner_repo:
+            return owner_repo
     except (subprocess.CalledProcessError, FileNotFoundError, OSError):
         # If git is not available, not on PATH, or remote is not configured, fall back
         pass
@@ -89,157 +141,358 @@ def _get_default_owner_repo() -> Tuple[str, str]:
 DEFAULT_OWNER = "tradmangh"
 DEFAULT_REPO = "LinkedIn-PostScraper"
 
-def parse_changelog(changelog_path: str) -> List[Tuple[str, str, str]]:
+def _is_digits(text: str) -> bool:
+    """Return True if text is a non-empty run of ASCII digits."""
+    return text.isascii() and text.isdigit()
+
+
+def _split_version_header(line: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Tokenize a '## [X.Y.Z] - YYYY-MM-DD' header with plain string operations.
+
+    Returns:
+        Tuple of (version, date, rest_of_line), or None if the line is not a version header.
+    """
+    ver_end = line.find(']', 4)
+    if ver_end == -1 or line[ver_end:ver_end + 4] != '] - ':
+        return None
+
+    version = line[4:ver_end]
+    parts = version.split('.')
+    if len(parts) != 3 or not all(_is_digits(part) for part in parts):
+        return None
+
+    date = line[ver_end + 4:ver_end + 14]
+    if (
+        len(date) != 10
+        or date[4] != '-'
+        or date[7] != '-'
+        or not _is_digits(date[:4] + date[5:7] + date[8:])
+    ):
+        return None
+
+    return version, date, line[ver_end + 14:]
+
+
+def _match_version_header(line: str) -> Optional[Tuple[str, str, str]]:
+    """Regex-based equivalent of _split_version_header (used by --legacy-parser)."""
+    match = _VERSION_RE.match(line)
+    if not match:
+        return None
+    return match.group(1), match.group(2), line[match.end():]
+
+
+def _decode_section(data: bytes) -> str:
+    """
+    Decode a section body, normalizing line endings like text-mode reads would.
+
+    A '---' rule that closes the section (e.g. before the end marker) is
+    dropped; the release body template adds its own separator.
+    """
+    text = data.decode('utf-8').replace('\r\n', '\n').strip()
+    head, sep, tail = text.rpartition('\n')
+    if tail == '---':
+        text = head.rstrip() if sep else ''
+    return text
+
+
+def _iter_changelog_sections(
+    mm: mmap.mmap,
+    parse_header: Callable[[str], Optional[Tuple[str, str, str]]] = _split_version_header,
+) -> Iterator[Tuple[str, str, str]]:
+    """
+    Yield (version, date, changelog_text) for each version section of a memory-mapped changelog.
+
+    Lines are scanned as raw bytes; only lines starting with '## [' are decoded
+    and passed to ``parse_header``. Each section body is decoded once, straight
+    from the mapping, so the rest of the file is never copied or decoded.
+    The end marker only ends the current section; version headers after it
+    are still picked up.
+    """
+    version = date = None
+    body_start = 0
+    section_end = None  # Offset of an end marker inside the current section
+
+    for line in iter(mm.readline, b''):
+        line_start = mm.tell() - len(line)
+        if line.startswith(_VERSION_PREFIX):
+            header = parse_header(line.decode('utf-8'))
+            if header:
+                if version is not None:
+                    end = line_start if section_end is None else section_end
+                    yield version, date, _decode_section(mm[body_start:end])
+                version, date, rest = header
+                # Text after the date on the header line belongs to the section
+                body_start = mm.tell() - len(rest.encode('utf-8'))
+                section_end = None
+                continue
+        elif line.startswith(_END_MARKER) and section_end is None:
+            section_end = line_start
+
+    if version is not None:
+        end = len(mm) if section_end is None else section_end
+        yield version, date, _decode_section(mm[body_start:end])
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_changelog_cached(
+    changelog_path: str, mtime_ns: int, size: int, legacy: bool
+) -> Tuple[Tuple[str, str, str], ...]:
+    """Parse a changelog; the stat fields only serve as cache key."""
+    if size == 0:
+        return ()  # mmap cannot map an empty file
+
+    parse_header = _match_version_header if legacy else _split_version_header
+    with open(changelog_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # The map is read front to back exactly once; let the kernel read ahead
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        return tuple(_iter_changelog_sections(mm, parse_header))
+
+
+def parse_changelog(changelog_path: str, legacy: bool = False) -> List[Tuple[str, str, str]]:
     """
     Parse CHANGELOG.md and extract version information.
+
+    Results are cached per file path, modification time and size, so repeated
+    calls only re-parse the file after it has changed.
+
+    Args:
+        changelog_path: Path to the CHANGELOG file
+        legacy: Match version headers with the original regex instead of string tokenization
     
     Returns:
         List of tuples: (version, date, changelog_text)
     """
-    with open(changelog_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Find all version sections
-    # Pattern: ## [X.Y.Z] - YYYY-MM-DD
-    version_pattern = r'## \[(\d+\.\d+\.\d+)\] - (\d{4}-\d{2}-\d{2})'
-    
-    versions = []
-    matches = list(re.finditer(version_pattern, content))
-    
-    for i, match in enumerate(matches):
-        version = match.group(1)
-        date = match.group(2)
-        
-        # Get the content between this version and the next
-        start_pos = match.end()
-        if i + 1 < len(matches):
-            end_pos = matches[i + 1].start()
-        else:
-            # Find the end marker (## AI Agent Instructions header or end of file)
-            end_marker = content.find('## AI Agent Instructions', start_pos)
-            if end_marker != -1:
-                end_pos = end_marker
-            else:
-                end_pos = len(content)
-        
-        changelog_text = content[start_pos:end_pos].strip()
-        versions.append((version, date, changelog_text))
-    
-    return versions
+    path = os.path.abspath(changelog_path)
+    st = os.stat(path)
+    return list(_parse_changelog_cached(path, st.st_mtime_ns, st.st_size, legacy))
 
 
-def create_git_tag(version: str, message: str) -> bool:
-    """Create a git tag for the version."""
-    tag_name = f"v{version}"
-    
+def list_version_tags() -> Set[str]:
+    """
+    Return all existing version tags (v*.*.*) using a single git invocation.
+
+    Raises:
+        subprocess.CalledProcessError: If git fails.
+    """
+    result = subprocess.run(
+        ['git', 'tag', '-l', 'v*.*.*'],
+        capture_output=True,
+        check=True
+    )
+    return {tag.strip() for tag in result.stdout.decode('utf-8').splitlines() if tag.strip()}
+
+
+def _decode_output(output) -> str:
+    """Decode captured subprocess output for error messages (bytes, str or None)."""
+    if isinstance(output, bytes):
+        return output.decode('utf-8', errors='replace')
+    return output or ""
+
+
+def _git_output(*args: str) -> str:
+    """Run a git command and return its stripped stdout."""
+    result = subprocess.run(['git', *args], capture_output=True, check=True)
+    return result.stdout.strip().decode('utf-8')
+
+
+def create_git_tags(
+    tags: List[Tuple[str, str]],
+    existing_tags: Optional[Set[str]] = None,
+    log: Callable[[str], None] = print,
+) -> bool:
+    """
+    Create annotated git tags for several versions with a fixed number of git calls.
+
+    Instead of one ``git tag -a`` process per version, the tag objects are
+    written in one ``git hash-object --stdin-paths`` call and all refs are
+    created in a single atomic ``git update-ref --stdin`` transaction.
+
+    Args:
+        tags: List of (version, message) tuples; versions have no leading 'v'
+        existing_tags: Version tags known to exist (see ``list_version_tags``).
+            Passing this avoids re-listing tags; newly created tags are added to the set.
+        log: Receives one progress message per call (defaults to print)
+
+    Returns:
+        True if every tag exists afterwards, False on a git error.
+    """
     try:
-        # Check if tag already exists
-        result = subprocess.run(
-            ['git', 'tag', '-l', tag_name],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        if result.stdout.strip():
-            print(f"  Tag {tag_name} already exists, skipping...")
+        if existing_tags is None:
+            existing_tags = list_version_tags()
+
+        new_tags = []
+        for version, message in tags:
+            tag_name = f"v{version}"
+            if tag_name in existing_tags:
+                log(f"  Tag {tag_name} already exists, skipping...")
+            else:
+                new_tags.append((tag_name, message))
+
+        if not new_tags:
             return True
-        
-        # Create annotated tag
+
+        head = _git_output('rev-parse', 'HEAD')
+        tagger = _git_output('var', 'GIT_COMMITTER_IDENT')
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = []
+            for i, (tag_name, message) in enumerate(new_tags):
+                path = os.path.join(tmp_dir, f"{i}.tag")
+                with open(path, 'w', encoding='utf-8', newline='\n') as f:
+                    f.write(
+                        f"object {head}\ntype commit\ntag {tag_name}\n"
+                        f"tagger {tagger}\n\n{message.rstrip()}\n"
+                    )
+                paths.append(path)
+
+            result = subprocess.run(
+                ['git', 'hash-object', '-t', 'tag', '-w', '--stdin-paths'],
+                input=b"".join(os.fsencode(path) + b"\n" for path in paths),
+                capture_output=True,
+                check=True
+            )
+        # Object names are plain hex, so ASCII decoding is exact
+        tag_shas = result.stdout.decode('ascii').split()
+
+        updates = "".join(
+            f"create refs/tags/{tag_name} {sha}\n"
+            for (tag_name, _), sha in zip(new_tags, tag_shas)
+        )
+        # Output is unused on success: discard stdout and keep stderr as raw bytes
         subprocess.run(
-            ['git', 'tag', '-a', tag_name, '-m', message],
-            check=True,
-            capture_output=True
+            ['git', 'update-ref', '--stdin'],
+            input=updates.encode('utf-8'),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            check=True
         )
-        print(f"  Created tag: {tag_name}")
-        return True
     except subprocess.CalledProcessError as e:
-        print(f"  Error creating tag {tag_name}: {e}")
+        log(f"  Error creating tags: {e}")
+        log(f"  stderr: {_decode_output(e.stderr)}")
         return False
 
+    for tag_name, _ in new_tags:
+        existing_tags.add(tag_name)
+        log(f"  Created tag: {tag_name}")
+    return True
+
+
+def create_git_tag(version: str, message: str, existing_tags: Optional[Set[str]] = None) -> bool:
+    """Create a git tag for the version (see ``create_git_tags``)."""
+    return create_git_tags([(version, message)], existing_tags)
+
+
+def push_tags(version_tags: Optional[Set[str]] = None) -> bool:
+    """
+    Push version tags (v*.*.*) to origin.
 
-def push_tags() -> bool:
-    """Push version tags (v*.*.*) to origin."""
+    Args:
+        version_tags: All local version tags, if already known (e.g. the set
+            maintained by ``create_git_tags``); otherwise git is asked.
+    """
     try:
-        # List version tags matching the v*.*.* pattern
-        list_result = subprocess.run(
-            ['git', 'tag', '-l', 'v*.*.*'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        tags = [tag.strip() for tag in list_result.stdout.splitlines() if tag.strip()]
+        if version_tags is None:
+            version_tags = list_version_tags()
+        tags = sorted(version_tags)
         if not tags:
             print("No version tags matching 'v*.*.*' found to push")
             return True
 
-        # Push only the matching version tags
+        # Push only the matching version tags; stderr is only decoded on failure
         subprocess.run(
             ['git', 'push', 'origin', *tags],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             check=True
         )
         print(f"Successfully pushed version tags to origin: {', '.join(tags)}")
         return True
     except subprocess.CalledProcessError as e:
         print(f"Error pushing tags: {e}")
-        print(f"stdout: {e.stdout}")
-        print(f"stderr: {e.stderr}")
+        print(f"stderr: {_decode_output(e.stderr)}")
         return False
 
 
-def create_github_release(
-    owner: str,
-    repo: str,
-    version: str,
-    changelog: str,
-    token: str,
-    timeout: int = 30
-) -> bool:
-    """Create a GitHub release using the API."""
-    tag_name = f"v{version}"
-    
-    # Check if release already exists
-    check_url = f"https://api.github.com/repos/{owner}/{repo}/releases/tags/{tag_name}"
-    headers = {
+def _github_headers(token: str) -> dict:
+    """Build the headers required by the GitHub REST API."""
+    return {
         "Accept": "application/vnd.github+json",
         "Authorization": f"Bearer {token}",
         "X-GitHub-Api-Version": "2022-11-28"
     }
-    
-    try:
-        check_response = requests.get(check_url, headers=headers, timeout=timeout)
-    except requests.exceptions.RequestException as e:
-        print(f"  Error checking for existing release {tag_name}: {e}")
-        return False
 
-    if check_response.status_code == 200:
-        print(f"  Release {tag_name} already exists, skipping...")
-        return True
-    elif check_response.status_code == 404:
-        # Release doesn't exist, continue with creation
-        pass
-    elif check_response.status_code in (401, 403):
-        print(
-            f"  Authentication/authorization error when checking for existing release {tag_name}: "
-            f"HTTP {check_response.status_code}. Please verify your GitHub token has access to "
-            f"{owner}/{repo}."
-        )
-        return False
-    else:
-        print(
-            f"  Unexpected response when checking for existing release {tag_name}: "
-            f"HTTP {check_response.status_code} - {check_response.text}"
-        )
-        return False
-    
-    # Prepare release body
-    release_body = f"""## 📝 What's New in v{version}
 
-{changelog}
+def _create_session(token: str, workers: int = DEFAULT_RELEASE_WORKERS) -> requests.Session:
+    """
+    Create a keep-alive HTTP session for the GitHub API.
+
+    All requests go to api.github.com, so a single host pool holds exactly one
+    keep-alive connection per release worker; ``pool_block`` makes a worker wait
+    for a warm connection instead of opening a throwaway one. Transient gateway
+    errors are retried with exponential back-off. urllib3 does not retry POST
+    by default, so release creation is never submitted twice.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update(_github_headers(token))
+    retries = Retry(total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=workers,
+        pool_block=True,
+        max_retries=retries,
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def _rate_limit_delay(response: requests.Response) -> Optional[float]:
+    """
+    Return how long to wait before retrying a rate-limited request, or None.
 
----
+    GitHub signals its (secondary) rate limits with 403/429 responses carrying
+    either a Retry-After header or an exhausted X-RateLimit-Remaining counter.
+    """
+    if response.status_code not in (403, 429):
+        return None
+
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(float(retry_after), MAX_RATE_LIMIT_WAIT)
+        except ValueError:
+            return None
+
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        reset = response.headers.get("X-RateLimit-Reset")
+        try:
+            return min(max(float(reset) - time.time(), 1.0), MAX_RATE_LIMIT_WAIT)
+        except (TypeError, ValueError):
+            return None
+
+    return None
+
+
+def _request_with_backoff(
+    http, method: str, url: str, log: Callable[[str], None] = print, **kwargs
+) -> requests.Response:
+    """Send a request, sleeping and retrying once if GitHub reports a rate limit."""
+    response = http.request(method, url, **kwargs)
+    delay = _rate_limit_delay(response)
+    if delay is not None:
+        log(f"  Rate limited by GitHub, retrying in {delay:.0f}s...")
+        time.sleep(delay)
+        response = http.request(method, url, **kwargs)
+    return response
+
+
+# Static part of every release body, appended after the version's changelog
+_RELEASE_BODY_FOOTER = """---
 
 ## 📦 Download Options
 
@@ -274,6 +527,132 @@ Browser included. Use if download is blocked or for offline use.
 
 See [CHANGELOG.md](https://github.com/{owner}/{repo}/blob/main/CHANGELOG.md) for complete details.
 """
+
+
+@functools.lru_cache(maxsize=None)
+def _release_body_footer(owner: str, repo: str) -> str:
+    """Render the release body footer once per repository."""
+    return _RELEASE_BODY_FOOTER.format(owner=owner, repo=repo)
+
+
+def list_release_tags(
+    owner: str,
+    repo: str,
+    session: requests.Session,
+    timeout: int = 30
+) -> Optional[Set[str]]:
+    """
+    Return the tag names of all existing releases (including drafts).
+
+    Uses the paginated list endpoint (100 releases per page, following the
+    ``Link: rel="next"`` header) instead of one request per version.
+
+    Returns:
+        Set of tag names, or None if the releases could not be listed.
+    """
+    import requests
+
+    url = f"https://api.github.com/repos/{owner}/{repo}/releases"
+    params = {"per_page": 100}
+    tags = set()
+
+    while url:
+        try:
+            response = _request_with_backoff(session, "GET", url, params=params, timeout=timeout)
+        except requests.exceptions.RequestException as e:
+            print(f"  Error listing existing releases: {e}")
+            return None
+
+        if response.status_code != 200:
+            print(
+                f"  Could not list existing releases for {owner}/{repo}: "
+                f"HTTP {response.status_code} - {response.text}"
+            )
+            return None
+
+        tags.update(release["tag_name"] for release in response.json())
+        # The "next" URL already carries the query string
+        url = response.links.get("next", {}).get("url")
+        params = None
+
+    return tags
+
+
+def _is_already_exists(response: requests.Response) -> bool:
+    """Check whether a release POST was rejected because the release exists."""
+    if response.status_code != 422:
+        return False
+    try:
+        errors = response.json().get("errors") or []
+    except ValueError:
+        return False
+    return any(isinstance(error, dict) and error.get("code") == "already_exists" for error in errors)
+
+
+def create_github_release(
+    owner: str,
+    repo: str,
+    version: str,
+    changelog: str,
+    token: str,
+    timeout: int = 30,
+    session: Optional[requests.Session] = None,
+    existing_releases: Optional[Set[str]] = None,
+    log: Callable[[str], None] = print,
+    assume_new: bool = False,
+) -> bool:
+    """
+    Create a GitHub release using the API.
+
+    Pass a shared ``session`` (see ``_create_session``) to reuse one keep-alive
+    connection across releases; it already carries the authentication headers.
+    Without one, the module-level ``requests`` functions are used.
+
+    Pass ``existing_releases`` (see ``list_release_tags``) to skip the
+    per-release existence check request. Set ``assume_new`` when the tag was
+    created in this run, so no release can reference it yet: the check is
+    skipped entirely, and a release that exists after all is recognised from
+    the POST's "already_exists" validation error. Progress messages go to ``log``.
+    """
+    import requests
+
+    http = session or requests
+    tag_name = f"v{version}"
+    headers = None if session is not None else _github_headers(token)
+
+    if assume_new:
+        release_exists = False
+    elif existing_releases is not None:
+        release_exists = tag_name in existing_releases
+    else:
+        check_url = f"https://api.github.com/repos/{owner}/{repo}/releases/tags/{tag_name}"
+        try:
+            check_response = _request_with_backoff(http, "GET", check_url, log=log, headers=headers, timeout=timeout)
+        except requests.exceptions.RequestException as e:
+            log(f"  Error checking for existing release {tag_name}: {e}")
+            return False
+
+        if check_response.status_code in (401, 403):
+            log(
+                f"  Authentication/authorization error when checking for existing release {tag_name}: "
+                f"HTTP {check_response.status_code}. Please verify your GitHub token has access to "
+                f"{owner}/{repo}."
+            )
+            return False
+        elif check_response.status_code not in (200, 404):
+            log(
+                f"  Unexpected response when checking for existing release {tag_name}: "
+                f"HTTP {check_response.status_code} - {check_response.text}"
+            )
+            return False
+        release_exists = check_response.status_code == 200
+
+    if release_exists:
+        log(f"  Release {tag_name} already exists, skipping...")
+        return True
+    
+    # Prepare release body: only the header and changelog vary per version
+    release_body = f"## 📝 What's New in v{version}\n\n{changelog}\n\n{_release_body_footer(owner, repo)}"
     
     api_url = f"https://api.github.com/repos/{owner}/{repo}/releases"
     
@@ -286,17 +665,32 @@ See [CHANGELOG.md](https://github.com/{owner}/{repo}/blob/main/CHANGELOG.md) for
         "prerelease": False
     }
     
+    # Serialize once (on the worker thread) and send the bytes as-is
+    payload = json.dumps(data, ensure_ascii=False).encode('utf-8')
+    post_headers = {**(headers or {}), "Content-Type": "application/json; charset=utf-8"}
+
     try:
-        response = requests.post(api_url, json=data, headers=headers, timeout=timeout)
-        response.raise_for_status()
-        print(f"  Created GitHub release: {tag_name}")
-        return True
+        response = _request_with_backoff(http, "POST", api_url, log=log, data=payload, headers=post_headers, timeout=timeout)
     except requests.exceptions.RequestException as e:
-        print(f"  Error creating GitHub release {tag_name}: {e}")
-        if hasattr(e, 'response') and e.response is not None:
-            print(f"  Response: {e.response.text}")
+        log(f"  Error creating GitHub release {tag_name}: {e}")
         return False
 
+    if response.status_code < 300:
+        log(f"  Created GitHub release: {tag_name}")
+        return True
+    if _is_already_exists(response):
+        log(f"  Release {tag_name} already exists, skipping...")
+        return True
+    log(f"  Error creating GitHub release {tag_name}: HTTP {response.status_code}")
+    log(f"  Response: {response.text}")
+    return False
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write buffered output lines to stdout with a single write call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
 
 def main():
     """Main function."""
@@ -315,7 +709,13 @@ def main():
                        help=f'Repository name (default: {DEFAULT_REPO})')
     parser.add_argument('--changelog', default='CHANGELOG.md',
                        help='Path to CHANGELOG file (default: CHANGELOG.md)')
+    parser.add_argument('--legacy-parser', action='store_true',
+                       help='Parse version headers with the original regex')
+    parser.add_argument('--workers', type=int, default=DEFAULT_RELEASE_WORKERS,
+                       help=f'Concurrent GitHub release requests (default: {DEFAULT_RELEASE_WORKERS})')
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
     
     # Get repository info from args
     owner = args.owner
@@ -324,19 +724,25 @@ def main():
     
     # Parse changelog
     print(f"Parsing {changelog_path}...")
-    versions = parse_changelog(changelog_path)
+    versions = parse_changelog(changelog_path, legacy=args.legacy_parser)
     
     if not versions:
         print(f"No versions found in {changelog_path}")
         sys.exit(1)
     
     print(f"Found {len(versions)} versions to release:")
-    for version, date, _ in versions:
-        print(f"  - v{version} ({date})")
+    _write_lines([f"  - v{version} ({date})" for version, date, _ in versions])
     
     # Create tags
     if not args.skip_tags:
         print("\nCreating git tags...")
+        try:
+            existing_tags = list_version_tags()
+        except subprocess.CalledProcessError as e:
+            print(f"Error listing existing git tags: {e}")
+            sys.exit(1)
+
+        tags = []
         for version, date, changelog in versions:
             # Use textwrap.shorten to truncate at word boundaries
             truncated = textwrap.shorten(
@@ -344,17 +750,25 @@ def main():
                 width=MAX_TAG_MESSAGE_LENGTH,
                 placeholder="..."
             )
-            message = f"Release v{version}\n\n{truncated}"
-            if not create_git_tag(version, message):
-                print(f"Failed to create git tag for version v{version}. Aborting before pushing tags or creating releases.")
-                sys.exit(1)
+            tags.append((version, f"Release v{version}\n\n{truncated}"))
+
+        tags_before = set(existing_tags)
+        messages: List[str] = []
+        tags_created = create_git_tags(tags, existing_tags, log=messages.append)
+        # Tags created just now cannot have a release yet
+        fresh_tags = existing_tags - tags_before
+        _write_lines(messages)
+        if not tags_created:
+            print("Failed to create git tags. Aborting before pushing tags or creating releases.")
+            sys.exit(1)
     else:
         print("\nSkipping git tag creation (--skip-tags specified)")
     
     # Push tags
     if not args.skip_push and not args.skip_tags:
         print("\nPushing tags to GitHub...")
-        if not push_tags():
+        # Tag creation already knows every version tag; no need to list them again
+        if not push_tags(existing_tags):
             print("Failed to push tags. Releases may not be created.")
             sys.exit(1)
     else:
@@ -382,10 +796,32 @@ def main():
             sys.exit(1)
         
         print("\nCreating GitHub releases...")
-        success_count = 0
-        for version, date, changelog in versions:
-            if create_github_release(owner, repo, version, changelog, token):
-                success_count += 1
+
+        with _create_session(token, args.workers) as session:
+            # One paginated listing replaces a GET per version; if it fails,
+            # create_github_release falls back to checking each tag itself.
+            # When every tag is fresh there is nothing to look up at all.
+            existing_releases = None
+            if any(f"v{version}" not in fresh_tags for version, _, _ in versions):
+                existing_releases = list_release_tags(owner, repo, session)
+
+            def release(entry: Tuple[str, str, str]) -> Tuple[bool, List[str]]:
+                version, _, changelog = entry
+                messages: List[str] = []
+                created = create_github_release(
+                    owner, repo, version, changelog, token,
+                    session=session, existing_releases=existing_releases,
+                    log=messages.append, assume_new=f"v{version}" in fresh_tags,
+                )
+                return created, messages
+
+            # Releases are independent, so overlap the network round-trips.
+            # Messages are buffered per release and written once, in changelog order.
+            with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                results = list(executor.map(release, versions))
+
+        _write_lines([line for _, messages in results for line in messages])
+        success_count = sum(created for created, _ in results)
         
         print(f"\n✅ Created {success_count}/{len(versions)} releases!")
         print(f"Check https://github.com/{owner}/{repo}/releases")
@@ -1,5 +1,6 @@
 """Configuration management for LinkedIn Post Scraper."""
 
+import copy
 import json
 import os
 
@@ -11,6 +12,13 @@ DEFAULT_CONFIG = {
     "appearance_mode": "system",  # "system", "light", or "dark"
 }
 
+# (config_path, settings) of the last config loaded or saved in this process
+_cached_config = None
+
+# Private config key holding (output_folder, resolved path) for get_output_folder.
+# Keys starting with "_" are runtime-only and never written to the config file.
+_RESOLVED_OUTPUT_KEY = "_resolved_output_folder"
+
 
 def get_app_dir():
     """Get the application root directory."""
@@ -33,43 +41,96 @@ def get_config_path():
     return os.path.join(get_user_data_dir(), CONFIG_FILE)
 
 
+def invalidate_config_cache():
+    """Forget the cached configuration so the next load reads the file again."""
+    global _cached_config
+    _cached_config = None
+
+
+def _cache_config(config_path: str, config: dict):
+    """Remember a copy of the settings last read from or written to config_path."""
+    global _cached_config
+    _cached_config = (config_path, copy.deepcopy(config))
+
+
+def _with_defaults(stored: dict) -> dict:
+    """Return the stored settings merged over the defaults, with old values migrated."""
+    # Merge with defaults to ensure new keys are present
+    merged = {**DEFAULT_CONFIG, **stored}
+    
+    # Migration: if output_folder is the old default "output", update it to the new default
+    if merged.get("output_folder") == "output":
+        merged["output_folder"] = DEFAULT_CONFIG["output_folder"]
+    return merged
+
+
 def load_config() -> dict:
-    """Load configuration from JSON file, creating defaults if needed."""
+    """Load configuration from JSON file, creating defaults if needed.
+    
+    The parsed settings are cached per process; every call returns a fresh
+    copy that callers may modify freely.
+    """
     config_path = get_config_path()
-    if os.path.exists(config_path):
+    cached = _cached_config
+    if cached is not None and cached[0] == config_path:
+        return copy.deepcopy(cached[1])
+
+    try:
         with open(config_path, "r", encoding="utf-8") as f:
             stored = json.load(f)
-            # Merge with defaults to ensure new keys are present
-            merged = {**DEFAULT_CONFIG, **stored}
-            
-            # Migration: if output_folder is the old default "output", update it to the new default
-            needs_save = False
-            if merged.get("output_folder") == "output":
-                merged["output_folder"] = DEFAULT_CONFIG["output_folder"]
-                needs_save = True
-            
-            # Auto-save migrated config
-            if needs_save:
-                save_config(merged)
-                
-            return merged
-    return DEFAULT_CONFIG.copy()
+    except FileNotFoundError:
+        return DEFAULT_CONFIG.copy()
+
+    merged = _with_defaults(stored)
+    
+    # Auto-save migrated config
+    if merged != {**DEFAULT_CONFIG, **stored}:
+        save_config(merged)
+
+    _cache_config(config_path, merged)
+    return merged
 
 
 def save_config(config: dict):
-    """Save configuration to JSON file."""
+    """Save configuration to JSON file.
+    
+    The write is skipped when the file already contains the same settings.
+    Runtime-only keys (prefixed with "_") are not saved.
+    """
+    config.pop(_RESOLVED_OUTPUT_KEY, None)
+    settings = {key: value for key, value in config.items() if not key.startswith("_")}
+
     # Ensure user data directory exists
     user_data_dir = get_user_data_dir()
     os.makedirs(user_data_dir, exist_ok=True)
     
     config_path = get_config_path()
-    with open(config_path, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
+    content = json.dumps(settings, indent=2)
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            unchanged = f.read() == content
+    except OSError:
+        unchanged = False  # Missing or unreadable file — (re)write it below
+
+    if not unchanged:
+        with open(config_path, "w", encoding="utf-8") as f:
+            f.write(content)
+    # Cache what load_config() would read back from this file
+    _cache_config(config_path, _with_defaults(settings))
 
 
 def get_output_folder(config: dict) -> str:
-    """Get the absolute path to the output folder."""
-    folder = config.get("output_folder", DEFAULT_CONFIG["output_folder"])
+    """Get the absolute path to the output folder.
+    
+    The resolved path is remembered in the config dict and reused until the
+    output_folder setting changes.
+    """
+    raw_folder = config.get("output_folder", DEFAULT_CONFIG["output_folder"])
+    cached = config.get(_RESOLVED_OUTPUT_KEY)
+    if cached is not None and cached[0] == raw_folder:
+        return cached[1]
+    
+    folder = raw_folder
     
     # Expand user tilde (~) if present
     folder = os.path.expanduser(folder)
@@ -82,6 +143,7 @@ def get_output_folder(config: dict) -> str:
     
     # NOTE: We do NOT create the folder here anymore. 
     # It is created only when saving posts to allow user to change it beforehand.
+    config[_RESOLVED_OUTPUT_KEY] = (raw_folder, folder)
     return folder
 
 
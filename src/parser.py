@@ -1,16 +1,33 @@
 """Parser for LinkedIn post HTML content."""
 
 import re
+import sys
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional
-from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
+# Class-name patterns used to locate post elements (compiled once at import)
+_AUTHOR_CLS_RE = re.compile(r"update-components-actor__name")
+_DATE_CLS_RE = re.compile(r"update-components-actor__sub-description")
+_CONTENT_CLS_RE = re.compile(r"feed-shared-update-v2__description")
+_COMMENTARY_CLS_RE = re.compile(r"feed-shared-update-v2__commentary")
+_TEXT_CLS_RE = re.compile(r"update-components-text")
+_MINI_UPDATE_CLS_RE = re.compile(r"feed-shared-mini-update-v2")
+_POLL_CLS_RE = re.compile(r"feed-shared-poll")
 
-@dataclass
+# Activity ID inside a URN like "urn:li:activity:1234567890"
+_URN_RE = re.compile(r"activity:(\d+)")
+
+
+# __slots__ drops the per-instance __dict__ (one Post per scraped post);
+# dataclass(slots=...) needs Python 3.10+, older versions keep a plain class.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Post:
     """Structured LinkedIn post data."""
     author: str = ""
@@ -26,37 +43,49 @@ class Post:
     element_id: str = ""     # LinkedIn URN
 
 
-def parse_relative_date(date_text: str) -> str:
+# Relative date patterns: 2h, 3d, 1w, 2mo, 1yr, "just now", "2 hours", "3 days", etc.
+# Each entry maps a match (and the reference datetime) to the resulting datetime;
+# None means "same day as the reference".
+_RELATIVE_DATE_PATTERNS = [
+    (re.compile(r"just\s*now"), None),
+    (re.compile(r"(\d+)\s*s(?:ec|econds?)?"), None),
+    (re.compile(r"(\d+)\s*m(?:in|inutes?)?(?!\w*o)"), None),
+    (re.compile(r"(\d+)\s*h(?:r|ours?)?"), lambda m, today: today - timedelta(hours=int(m.group(1)))),
+    (re.compile(r"(\d+)\s*d(?:ays?)?"), lambda m, today: today - timedelta(days=int(m.group(1)))),
+    (re.compile(r"(\d+)\s*w(?:k|eeks?)?"), lambda m, today: today - timedelta(weeks=int(m.group(1)))),
+    (re.compile(r"(\d+)\s*mo(?:nths?)?"), lambda m, today: today - timedelta(days=int(m.group(1)) * 30)),
+    (re.compile(r"(\d+)\s*yr?(?:ears?)?"), lambda m, today: today - timedelta(days=int(m.group(1)) * 365)),
+]
+
+
+# Folds the middle dot onto the bullet so one partition() finds either separator
+_DATE_SEPARATORS = str.maketrans({"·": "•"})
+
+
+def parse_relative_date(date_text: str, today: Optional[datetime] = None) -> str:
     """Convert LinkedIn's relative date text to YYYY-MM-DD format.
     
     Handles formats like: '2h', '3d', '1w', '2mo', '1yr', '2h •', etc.
+
+    Args:
+        date_text: Date text as shown by LinkedIn
+        today: Reference time for relative dates. Pass the same value for a
+            whole batch to read the clock once; defaults to now.
     """
+    if today is None:
+        today = datetime.today()
+
     if not date_text:
-        return datetime.today().strftime("%Y-%m-%d")
-
-    # Clean up the text — remove bullet/dot separators and extra whitespace
-    cleaned = date_text.strip().split("•")[0].strip().split("·")[0].strip()
-    cleaned = cleaned.lower()
-
-    today = datetime.today()
-
-    # Try to match relative date patterns
-    # Patterns: 2h, 3d, 1w, 2mo, 1yr, "just now", "2 hours", "3 days", etc.
-    patterns = [
-        (r"just\s*now", lambda m: today),
-        (r"(\d+)\s*s(?:ec|econds?)?", lambda m: today),
-        (r"(\d+)\s*m(?:in|inutes?)?(?!\w*o)", lambda m: today),
-        (r"(\d+)\s*h(?:r|ours?)?", lambda m: today - timedelta(hours=int(m.group(1)))),
-        (r"(\d+)\s*d(?:ays?)?", lambda m: today - timedelta(days=int(m.group(1)))),
-        (r"(\d+)\s*w(?:k|eeks?)?", lambda m: today - timedelta(weeks=int(m.group(1)))),
-        (r"(\d+)\s*mo(?:nths?)?", lambda m: today - timedelta(days=int(m.group(1)) * 30)),
-        (r"(\d+)\s*yr?(?:ears?)?", lambda m: today - timedelta(days=int(m.group(1)) * 365)),
-    ]
-
-    for pattern, calc in patterns:
-        match = re.match(pattern, cleaned)
+        return today.strftime("%Y-%m-%d")
+
+    # Clean up the text — keep what precedes the first bullet/dot separator
+    cleaned = date_text.translate(_DATE_SEPARATORS).partition("•")[0].strip().lower()
+
+    for pattern, calc in _RELATIVE_DATE_PATTERNS:
+        match = pattern.match(cleaned)
         if match:
-            return calc(match).strftime("%Y-%m-%d")
+            result = calc(match, today) if calc else today
+            return result.strftime("%Y-%m-%d")
 
     # If it looks like a date already, try to parse it
     for fmt in ["%Y-%m-%d", "%b %d, %Y", "%d %b %Y", "%m-%d-%Y"]:
@@ -73,16 +102,18 @@ def parse_relative_date(date_text: str) -> str:
 def _convert_engagement_number(text: str) -> int:
     """Convert abbreviated numbers like '1.2K' to integers."""
     text = text.strip().replace(",", "")
+    # Common case: a plain count like "42"
+    if text.isdecimal():
+        return int(text)
     if not text:
         return 0
-    text_upper = text.upper()
     try:
-        if "K" in text_upper:
-            return int(float(text_upper.replace("K", "")) * 1000)
-        elif "M" in text_upper:
-            return int(float(text_upper.replace("M", "")) * 1000000)
+        if text.endswith(("K", "k")):
+            return int(float(text[:-1]) * 1000)
+        elif text.endswith(("M", "m")):
+            return int(float(text[:-1]) * 1000000)
         else:
-            return int(re.sub(r"[^\d]", "", text) or 0)
+            return int("".join(ch for ch in text if ch.isdecimal()) or 0)
     except (ValueError, TypeError):
         return 0
 
@@ -98,21 +129,84 @@ def _get_text(soup, selector: str, attrs: dict) -> str:
     return ""
 
 
-def _extract_media(soup) -> tuple[str, str]:
-    """Extract media type and link from a post."""
-    media_checks = [
-        ("div", {"class": "update-components-video"}, "Video"),
-        ("div", {"class": "update-components-linkedin-video"}, "Video"),
-        ("div", {"class": "update-components-image"}, "Image"),
-        ("article", {"class": "update-components-article"}, "Article"),
-        ("div", {"class": "feed-shared-external-video__meta"}, "YouTube Video"),
-        ("div", {"class": re.compile(r"feed-shared-mini-update-v2")}, "Shared Post"),
-        ("div", {"class": re.compile(r"feed-shared-poll")}, "Poll"),
-    ]
-
-    for tag, attrs, media_type in media_checks:
-        el = soup.find(tag, attrs)
-        if el:
+# Media containers in priority order: (tag name, class matcher, media type).
+# A str matcher must equal one of the element's classes; a compiled pattern
+# is searched in its class attribute.
+_MEDIA_CHECKS = (
+    ("div", "update-components-video", "Video"),
+    ("div", "update-components-linkedin-video", "Video"),
+    ("div", "update-components-image", "Image"),
+    ("article", "update-components-article", "Article"),
+    ("div", "feed-shared-external-video__meta", "YouTube Video"),
+    ("div", _MINI_UPDATE_CLS_RE, "Shared Post"),
+    ("div", _POLL_CLS_RE, "Poll"),
+)
+
+# Single post elements located by class pattern: (key, tag name, pattern)
+_ELEMENT_CHECKS = (
+    ("author", "span", _AUTHOR_CLS_RE),
+    ("date", "span", _DATE_CLS_RE),
+    ("content", "div", _CONTENT_CLS_RE),
+    ("commentary", "div", _COMMENTARY_CLS_RE),
+    ("text", "span", _TEXT_CLS_RE),
+)
+
+# Content sources, tried in order until one yields text
+_CONTENT_KEYS = ("content", "commentary", "text")
+
+# _MEDIA_CHECKS split by matcher kind, built once: exact classes map straight
+# to their check index (one dict lookup per class), patterns keep a scan.
+_MEDIA_CLASS_INDEX = {
+    sys.intern(matcher): i
+    for i, (_, matcher, _) in enumerate(_MEDIA_CHECKS)
+    if isinstance(matcher, str)
+}
+_MEDIA_PATTERN_CHECKS = tuple(
+    (i, tag, matcher)
+    for i, (tag, matcher, _) in enumerate(_MEDIA_CHECKS)
+    if not isinstance(matcher, str)
+)
+
+
+def _scan_post(soup) -> tuple[dict, list, list]:
+    """Walk the post DOM once and collect the elements ``parse_post`` needs.
+
+    Returns:
+        Tuple of (first element per ``_ELEMENT_CHECKS`` key, first element per
+        ``_MEDIA_CHECKS`` entry or None, aria-labelled buttons in document order).
+    """
+    found = {}
+    media = [None] * len(_MEDIA_CHECKS)
+    buttons = []
+    for el in soup.descendants:
+        name = el.name
+        if name is None:
+            continue  # text node
+        if name == "button":
+            if el.get("aria-label") is not None:
+                buttons.append(el)
+            continue
+        classes = el.get("class")
+        if not classes:
+            continue
+        class_str = " ".join(classes)
+        for key, tag, pattern in _ELEMENT_CHECKS:
+            if name == tag and key not in found and pattern.search(class_str):
+                found[key] = el
+        for cls in classes:
+            i = _MEDIA_CLASS_INDEX.get(cls)
+            if i is not None and media[i] is None and name == _MEDIA_CHECKS[i][0]:
+                media[i] = el
+        for i, tag, pattern in _MEDIA_PATTERN_CHECKS:
+            if name == tag and media[i] is None and pattern.search(class_str):
+                media[i] = el
+    return found, media, buttons
+
+
+def _extract_media(media: list) -> tuple[str, str]:
+    """Pick media type and link from the containers found by ``_scan_post``."""
+    for el, (_, _, media_type) in zip(media, _MEDIA_CHECKS):
+        if el is not None:
             link_el = el.find("a", href=True)
             link = link_el["href"] if link_el else ""
             return media_type, link
@@ -120,86 +214,97 @@ def _extract_media(soup) -> tuple[str, str]:
     return "", ""
 
 
-def _extract_engagement(soup, keyword: str) -> int:
-    """Extract engagement count (reactions/comments/reposts) from post HTML."""
+_ENGAGEMENT_KEYWORDS = ("reaction", "comment", "repost")
+
+
+def _extract_engagement(buttons: list) -> dict[str, int]:
+    """Extract engagement counts (reactions/comments/reposts) from post buttons.
+    
+    Classifies the aria-labelled buttons found by ``_scan_post`` by keyword.
+    
+    Returns:
+        Dict mapping each keyword in _ENGAGEMENT_KEYWORDS to its count.
+    """
+    counts = dict.fromkeys(_ENGAGEMENT_KEYWORDS, 0)
     try:
-        buttons = soup.find_all(
-            lambda tag: tag.name == "button"
-            and "aria-label" in tag.attrs
-            and keyword in tag["aria-label"].lower()
-        )
-        if buttons:
-            # Sometimes there are duplicate buttons; use the last one with text
-            for btn in reversed(buttons):
-                text = btn.get_text(strip=True)
-                if text:
-                    return _convert_engagement_number(text)
+        # Sometimes there are duplicate buttons; use the last one with text
+        pending = set(_ENGAGEMENT_KEYWORDS)
+        for btn in reversed(buttons):
+            label = btn["aria-label"].lower()
+            matched = [keyword for keyword in pending if keyword in label]
+            if not matched:
+                continue
+            text = btn.get_text(strip=True)
+            if not text:
+                continue
+            value = _convert_engagement_number(text)
+            for keyword in matched:
+                counts[keyword] = value
+                pending.discard(keyword)
+            if not pending:
+                break
     except Exception:
         pass
-    return 0
+    return counts
 
 
-def parse_post(raw_html: str, date_text: str = "", element_id: str = "") -> Post:
-    """Parse a raw LinkedIn post HTML into a structured Post object."""
-    soup = BeautifulSoup(raw_html, "html.parser")
+def _visible_text(el) -> str:
+    """Get an element's text, preferring its visually-hidden accessible copy."""
+    hidden = el.find("span", {"class": "visually-hidden"})
+    return (hidden or el).get_text(strip=True)
+
+
+def parse_post(raw_html: str, date_text: str = "", element_id: str = "", today: Optional[datetime] = None) -> Post:
+    """Parse a raw LinkedIn post HTML into a structured Post object.
+    
+    ``today`` is the reference time for relative dates (see ``parse_relative_date``).
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(raw_html, "lxml")
+    found, media, buttons = _scan_post(soup)
 
     # Author
     author = ""
-    author_el = soup.find("span", {"class": re.compile(r"update-components-actor__name")})
+    author_el = found.get("author")
     if author_el:
-        # Get the visually-hidden span inside for clean text
-        hidden = author_el.find("span", {"class": "visually-hidden"})
-        if hidden:
-            author = hidden.get_text(strip=True)
-        else:
-            author = author_el.get_text(strip=True)
+        # Prefer the visually-hidden span inside for clean text
+        author = _visible_text(author_el)
 
     # Date
     if not date_text:
-        time_el = soup.find("span", {"class": re.compile(r"update-components-actor__sub-description")})
+        time_el = found.get("date")
         if time_el:
-            hidden = time_el.find("span", {"class": "visually-hidden"})
-            date_text = hidden.get_text(strip=True) if hidden else time_el.get_text(strip=True)
+            date_text = _visible_text(time_el)
 
-    post_date = parse_relative_date(date_text)
+    post_date = parse_relative_date(date_text, today)
 
-    # Content text
+    # Content text: description, then commentary block, then plain text span
     content = ""
-    content_el = soup.find("div", {"class": re.compile(r"feed-shared-update-v2__description")})
-    if content_el:
+    for key in _CONTENT_KEYS:
+        content_el = found.get(key)
+        if content_el is None:
+            continue
         # Get text preserving some structure
         for br in content_el.find_all("br"):
             br.replace_with("\n")
         content = content_el.get_text(strip=False).strip()
-    if not content:
-        # Fallback: commentary block
-        commentary_el = soup.find("div", {"class": re.compile(r"feed-shared-update-v2__commentary")})
-        if commentary_el:
-            for br in commentary_el.find_all("br"):
-                br.replace_with("\n")
-            content = commentary_el.get_text(strip=False).strip()
-    if not content:
-        text_el = soup.find("span", {"class": re.compile(r"update-components-text")})
-        if text_el:
-            for br in text_el.find_all("br"):
-                br.replace_with("\n")
-            content = text_el.get_text(strip=False).strip()
+        if content:
+            break
 
     # Post URL from URN
     post_url = ""
     if element_id:
         # Extract activity ID from URN like "urn:li:activity:1234567890"
-        urn_match = re.search(r"activity:(\d+)", element_id)
+        urn_match = _URN_RE.search(element_id)
         if urn_match:
             post_url = f"https://www.linkedin.com/feed/update/urn:li:activity:{urn_match.group(1)}/"
 
     # Media
-    media_type, media_link = _extract_media(soup)
+    media_type, media_link = _extract_media(media)
 
     # Engagement
-    reactions = _extract_engagement(soup, "reaction")
-    comments = _extract_engagement(soup, "comment")
-    reposts = _extract_engagement(soup, "repost")
+    engagement = _extract_engagement(buttons)
 
     return Post(
         author=author,
@@ -207,9 +312,9 @@ def parse_post(raw_html: str, date_text: str = "", element_id: str = "") -> Post
         date_raw=date_text,
         content=content,
         post_url=post_url,
-        reactions=reactions,
-        comments=comments,
-        reposts=reposts,
+        reactions=engagement["reaction"],
+        comments=engagement["comment"],
+        reposts=engagement["repost"],
         media_type=media_type,
         media_link=media_link,
         element_id=element_id,
@@ -1,17 +1,227 @@
 """LinkedIn post scraper using Playwright with persistent session."""
 
+import os
 import re
+import asyncio
+import sys
 import time
+import queue
 import random
 import logging
-from dataclasses import dataclass, field
-from typing import Optional
-from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+from urllib.parse import urlsplit
+from playwright.async_api import async_playwright
+from playwright.sync_api import sync_playwright, Browser, BrowserContext, Locator, Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 logger = logging.getLogger(__name__)
 
+# Base profile URL (up to and including the username) at the start of a URL
+_PROFILE_BASE_RE = re.compile(r"(https://(?:www\.)?linkedin\.com/in/[^/?#]+)")
+# Canonical (www) profile URL, as LinkedIn redirects to after login
+_PROFILE_URL_RE = re.compile(r"(https://www\.linkedin\.com/in/[^/?#]+)")
 
-@dataclass
+# Top-level paths of pages LinkedIn only serves to a signed-in member
+_LOGGED_IN_PATHS = ("/feed", "/mynetwork")
+
+
+def _is_logged_in_url(url: str, extra_paths: tuple = ()) -> bool:
+    """Return True if url's path is a signed-in page (query string ignored).
+    
+    Paths match whole segments: "/feed" and "/feed/..." count, "/feed-x" does not.
+    """
+    path = urlsplit(url).path
+    return any(
+        path == prefix or path.startswith(prefix + "/")
+        for prefix in _LOGGED_IN_PATHS + extra_paths
+    )
+
+
+# Scroll to the bottom, then resolve with the new page height once the feed has
+# seen no DOM mutations for idleMs (or after maxMs). One round trip per scroll.
+_SCROLL_AND_WAIT_JS = """
+    async ({idleMs, maxMs}) => {
+        const feed = document.querySelector('.scaffold-finite-scroll__content') || document.body;
+        const start = performance.now();
+        let lastChange = start;
+        const observer = new MutationObserver(() => { lastChange = performance.now(); });
+        observer.observe(feed, {childList: true, subtree: true});
+        window.scrollTo(0, document.body.scrollHeight);
+        await new Promise(resolve => {
+            const check = () => {
+                const now = performance.now();
+                if (now - lastChange >= idleMs || now - start >= maxMs) {
+                    resolve();
+                } else {
+                    setTimeout(check, 50);
+                }
+            };
+            setTimeout(check, 50);
+        });
+        observer.disconnect();
+        return document.body.scrollHeight;
+    }
+"""
+
+
+# CSS selectors shared by the in-page scripts below (passed in as arguments)
+_SELECTORS = {
+    "post": 'div.feed-shared-update-v2[data-urn*="activity"]',
+    "date": ".update-components-actor__sub-description span.visually-hidden",
+    # Headline sources; the first one present in the post (document order) wins
+    "headline": ":is({})".format(", ".join([
+        ".feed-shared-update-v2__description .update-components-text",
+        ".feed-shared-update-v2__commentary",
+        ".update-components-text",
+    ])),
+}
+
+# Activity feed is ready once the first post, LinkedIn's empty-feed notice or a
+# login form has rendered (the caller then checks the URL for a login redirect)
+_FEED_READY_SELECTOR = ", ".join([
+    _SELECTORS["post"],
+    ".artdeco-empty-state",
+    "form.login__form",
+])
+
+# Home feed (is_logged_in): any post or the main layout column, or a login form
+_HOME_FEED_READY_SELECTOR = "div.feed-shared-update-v2, main.scaffold-layout__main, form.login__form"
+
+# LinkedIn can render the same URN more than once (recycled list items, reposts
+# sharing the original's URN). Posts are counted and indexed by first occurrence.
+# These scripts run through locator.evaluate_all, which hands them the matched
+# post elements, so they take the element array instead of querying again.
+_COUNT_POSTS_JS = """
+    (posts) => new Set(posts.map(post => post.dataset.urn)).size
+"""
+
+# DOM positions (in the post selector's NodeList) of each distinct post
+_UNIQUE_POST_POSITIONS_JS = """
+    (posts) => {
+        const seen = new Set();
+        const positions = [];
+        for (let i = 0; i < posts.length; i++) {
+            const urn = posts[i].dataset.urn;
+            if (!urn || seen.has(urn)) continue;
+            seen.add(urn);
+            positions.push(i);
+        }
+        return positions;
+    }
+"""
+
+# Post previews (date, first 120 chars of text, URN and optionally the full
+# HTML) of the loaded posts whose URN is not in seen. Run after every scroll,
+# so each call only serializes what the last scroll revealed; the page itself
+# is left untouched.
+_DRAIN_POSTS_JS = """
+    (posts, {selectors, captureHtml, seen}) => {
+        const known = new Set(seen);
+        const results = [];
+        for (const post of posts) {
+            const urn = post.dataset.urn;
+            if (!urn || known.has(urn)) continue;
+            known.add(urn);
+            const timeEl = post.querySelector(selectors.date);
+            const contentEl = post.querySelector(selectors.headline);
+            const headline = contentEl ? contentEl.textContent.trim().substring(0, 120) : '';
+            results.push({
+                dateText: timeEl ? timeEl.textContent.trim() : '',
+                headline: headline || '(No text content)',
+                elementId: urn,
+                html: captureHtml ? post.outerHTML : ''
+            });
+        }
+        return results;
+    }
+"""
+
+# Full HTML, date text and URN of a single post element
+_POST_DATA_JS = """
+    (post, dateSel) => {
+        const timeEl = post.querySelector(dateSel);
+        return {
+            html: post.outerHTML,
+            dateText: timeEl ? timeEl.textContent.trim() : '',
+            elementId: post.dataset.urn || ''
+        };
+    }
+"""
+
+# Same fields for the loaded post with a given URN (null if it is not in the page)
+_POST_BY_URN_JS = """
+    (posts, {urn, dateSel}) => {
+        const post = posts.find(p => p.dataset.urn === urn);
+        if (!post) return null;
+        const timeEl = post.querySelector(dateSel);
+        return {
+            html: post.outerHTML,
+            dateText: timeEl ? timeEl.textContent.trim() : '',
+            elementId: urn
+        };
+    }
+"""
+
+
+def _is_unavailable_profile_url(url: str) -> bool:
+    """Return True if a profile visit ended on the auth wall, login or 404 page."""
+    return "authwall" in url or "login" in url or "/404/" in url
+
+
+# LinkedIn's 404 / unavailable-profile page, checked in the page so the
+# document never has to be serialized back to Python
+_PROFILE_UNAVAILABLE_JS = """
+    () => document.title.includes('Page not found')
+        || document.documentElement.outerHTML.includes('profile is not available')
+"""
+
+_VOYAGER_API_PREFIX = "https://www.linkedin.com/voyager/api/"
+# Lower-cased URL fragments of the Voyager queries that return a member's
+# activity: GraphQL "...ProfileUpdates" / "...MemberShareFeed" queries and the
+# REST profileUpdates endpoints
+_VOYAGER_FEED_QUERIES = ("profileupdates", "membersharefeed")
+
+
+def _is_voyager_feed_url(url: str) -> bool:
+    """Return True if url is a Voyager API call for a member's activity feed."""
+    if not url.startswith(_VOYAGER_API_PREFIX):
+        return False
+    url = url.lower()
+    return any(query in url for query in _VOYAGER_FEED_QUERIES)
+
+
+def _voyager_update_preview(entity) -> Optional[dict]:
+    """Decode a feed update entity from a Voyager API response into scan preview fields.
+    
+    Returns None for entities that are not activity updates.
+    """
+    if not isinstance(entity, dict):
+        return None
+    urn = (entity.get("metadata") or {}).get("backendUrn") or ""
+    if "activity:" not in urn:
+        return None
+    sub_description = (entity.get("actor") or {}).get("subDescription") or {}
+    date_text = sub_description.get("accessibilityText") or sub_description.get("text") or ""
+    text = (entity.get("commentary") or {}).get("text") or ""
+    if isinstance(text, dict):
+        text = text.get("text") or ""
+    return {
+        "dateText": date_text.strip(),
+        "headline": text.strip()[:120] or "(No text content)",
+        "elementId": urn,
+    }
+
+
+# One preview/raw post per feed item; __slots__ (Python 3.10+) drops the per-instance dict
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class PostPreview:
     """Lightweight post preview for the scan phase."""
     index: int
@@ -20,7 +230,7 @@ class PostPreview:
     element_id: str  # data-urn or similar identifier
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RawPost:
     """Raw post data extracted from LinkedIn."""
     html: str
@@ -29,41 +239,311 @@ class RawPost:
     index: int
 
 
+def _on_browser_thread(method):
+    """Run a LinkedInScraper method on the scraper's dedicated browser thread.
+    
+    Playwright's sync API objects may only be used from the thread that created
+    them. Funnelling every browser call through one long-lived thread lets the
+    context stay open between calls made from different (UI worker) threads.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return self._run_on_browser_thread(method, self, *args, **kwargs)
+    return wrapper
+
+
 class LinkedInScraper:
-    """Scrapes LinkedIn posts using Playwright with persistent browser session."""
+    """Scrapes LinkedIn posts using Playwright with persistent browser session.
+    
+    The browser context is kept open between calls so that e.g. a scan followed
+    by a scrape share one Chromium launch. Call close() (or use the scraper as
+    a context manager) to shut it down.
+    """
 
     SCROLL_PAUSE_TIME = 2.0
     MAX_NO_CHANGE = 3
+
+    # After each scroll, wait in-page until the feed has stopped changing for a
+    # random quiet period (ms) instead of sleeping DELAY_BETWEEN_SCROLLS.
+    # Set USE_SCROLL_POLLING to go back to fixed sleeps (for debugging).
+    SCROLL_IDLE_MS = (600, 1200)
+    SCROLL_MAX_WAIT_MS = 10_000
+    # Unchanged scrolls that still have a feed API request in flight (slow
+    # connection, throttled feed) do not count towards MAX_NO_CHANGE, up to
+    # this many in a row
+    MAX_FEED_WAIT_ROUNDS = 10
+    USE_SCROLL_POLLING = False
     
     # Human-like delay ranges (in seconds)
     DELAY_BETWEEN_SCROLLS = (1.5, 3.0)  # Random delay between scrolls
     DELAY_BETWEEN_CLICKS = (0.8, 1.5)   # Random delay between clicks
     DELAY_AFTER_LOAD = (2.0, 3.5)       # Random delay after page load
 
-    def __init__(self, browser_state_dir: str):
+    # Request types that never contribute to the post DOM we scrape; aborted
+    # in headless runs to cut download/decode work and browser memory
+    BLOCKED_RESOURCE_TYPES = frozenset({
+        "image", "imageset", "media", "font", "stylesheet",
+        "texttrack", "beacon", "csp_report",
+    })
+
+    # Chromium flags for every launch: hide the automation flag and keep timers
+    # and rendering at full speed so the virtualized feed loads while scrolling
+    BROWSER_ARGS = (
+        "--disable-blink-features=AutomationControlled",
+        "--disable-background-timer-throttling",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-renderer-backgrounding",
+        "--disable-features=Translate,AcceptCHFrame,MediaRouter",
+        "--no-default-browser-check",
+        "--disable-ipc-flooding-protection",
+    )
+    # Extra flags when assets are blocked: skip image decoding altogether
+    BLOCKED_ASSET_ARGS = ("--blink-settings=imagesEnabled=false",)
+
+    # Visible windows keep a desktop size; headless runs use a tall, narrow
+    # viewport so each scroll reveals more posts for less layout work
+    WINDOW_VIEWPORT = {"width": 1280, "height": 900}
+    HEADLESS_VIEWPORT = {"width": 800, "height": 2000}
+
+    # Cookie/local-storage export of the logged-in session, inside browser_state_dir
+    STORAGE_STATE_FILE = "state.json"
+
+    def __init__(self, browser_state_dir: str, debug_snapshot: bool = False):
         self.browser_state_dir = browser_state_dir
+        # Save the page HTML to debug/linkedin_page.html on every scan; otherwise
+        # only when a scan finds no posts
+        self.debug_snapshot = debug_snapshot
         self._playwright = None
+        self._browser: Optional[Browser] = None  # Only for storage-state contexts
         self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
+        # Locators for the post selectors on self._page, built with the page
+        self._post_locator: Optional[Locator] = None
+        self._context_mode: Optional[tuple[bool, bool]] = None  # (headless, block_assets)
+        # Posts (html, dateText, elementId) captured by the last scan_posts call,
+        # in page order, and the activity URL they came from
+        self._last_scan: list[dict] = []
+        self._last_scan_url: Optional[str] = None
+        # Post previews decoded from LinkedIn's feed API responses, keyed by URN
+        self._voyager_posts: dict[str, dict] = {}
+        # Feed API requests in flight; a scroll with one pending is not "no change"
+        self._feed_requests: set = set()
+        self._browser_thread: Optional[threading.Thread] = None
+        self._browser_calls: queue.Queue = queue.Queue()
+        self._browser_thread_lock = threading.Lock()
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _run_on_browser_thread(self, fn, *args, **kwargs):
+        """Call fn on the browser thread (starting it if needed) and return its result."""
+        if threading.current_thread() is self._browser_thread:
+            return fn(*args, **kwargs)
+        with self._browser_thread_lock:
+            if self._browser_thread is None:
+                # Daemon, like the UI workers: a pending login must not block app exit
+                self._browser_thread = threading.Thread(
+                    target=self._browser_loop, name="playwright", daemon=True
+                )
+                self._browser_thread.start()
+        future = Future()
+        self._browser_calls.put((future, fn, args, kwargs))
+        return future.result()
+
+    def _browser_loop(self):
+        """Browser thread main loop: execute queued calls one at a time."""
+        while True:
+            future, fn, args, kwargs = self._browser_calls.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
     
     def _human_delay(self, delay_range: tuple[float, float]):
         """Sleep for a random duration within the given range to simulate human behavior."""
         delay = random.uniform(*delay_range)
         time.sleep(delay)
 
-    def _ensure_context(self, headless: bool = False):
-        """Create or reuse a persistent browser context."""
-        if self._context is not None:
+    def _block_heavy_assets(self, route):
+        """Route handler: abort requests whose resource type is not needed for scraping."""
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        """Single background thread for file writes off the browser thread."""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scraper-io")
+        return self._io_pool
+
+    @staticmethod
+    def _write_debug_html(html_content: str, debug_file: str):
+        """Write a page HTML snapshot for selector debugging (runs on the I/O thread)."""
+        try:
+            os.makedirs(os.path.dirname(debug_file), exist_ok=True)
+            Path(debug_file).write_text(html_content, encoding="utf-8")
+            logger.info(f"Saved debug HTML to {debug_file}")
+        except Exception as e:
+            logger.warning(f"Could not save debug HTML: {e}")
+
+    def _save_debug_snapshot(self, on_status=None):
+        """Queue the current page's HTML for writing to debug/linkedin_page.html."""
+        try:
+            debug_file = os.path.join(os.path.dirname(self.browser_state_dir), "debug", "linkedin_page.html")
+            self._get_io_pool().submit(self._write_debug_html, self._page.content(), debug_file)
+            if on_status:
+                on_status(f"Debug: Saving page HTML to {debug_file}")
+        except Exception as e:
+            logger.warning(f"Could not save debug HTML: {e}")
+
+    def _wait_for_selector(self, selector: str, timeout: int = 15000) -> bool:
+        """Wait until selector matches on the current page; False on timeout."""
+        try:
+            self._page.wait_for_selector(selector, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            logger.debug("Timed out waiting for %s on %s", selector, self._page.url)
+            return False
+
+    def _capture_voyager(self, response):
+        """Response handler: collect post previews from LinkedIn's profile feed API."""
+        if not _is_voyager_feed_url(response.url):
             return
+        try:
+            payload = response.json()
+        except Exception:
+            return  # Not JSON (or body unavailable) — the DOM path still works
+        if not isinstance(payload, dict):
+            return
+        for entity in payload.get("included") or ():
+            preview = _voyager_update_preview(entity)
+            if preview and preview["elementId"] not in self._voyager_posts:
+                self._voyager_posts[preview["elementId"]] = preview
+
+    def _track_feed_request(self, request):
+        """Request handler: remember feed API calls that are still loading."""
+        if _is_voyager_feed_url(request.url):
+            self._feed_requests.add(request)
+
+    def _untrack_feed_request(self, request):
+        """Request finished/failed handler: forget a feed API call."""
+        self._feed_requests.discard(request)
+
+    def _voyager_previews(self, scanned: Optional[dict] = None) -> list[dict]:
+        """Captured API previews as scan results.
+        
+        With ``scanned`` (the DOM previews by URN, in page order) the page
+        decides order and index, so each preview lines up with the post at its
+        DOM position; API data replaces the DOM's where the URN was captured.
+        Without it the previews come in the order the responses arrived.
+        """
+        if scanned:
+            return [
+                {**self._voyager_posts.get(urn, dom_preview), "index": dom_preview["index"], "html": ""}
+                for urn, dom_preview in scanned.items()
+            ]
+        return [
+            {**preview, "index": idx, "html": ""}
+            for idx, preview in enumerate(self._voyager_posts.values())
+        ]
+
+    @property
+    def storage_state_path(self) -> str:
+        """Path of the exported session used by headless read-only contexts."""
+        return os.path.join(self.browser_state_dir, self.STORAGE_STATE_FILE)
+
+    def _save_storage_state(self):
+        """Export the current context's session to storage_state_path."""
+        try:
+            self._context.storage_state(path=self.storage_state_path)
+        except Exception as e:
+            logger.warning(f"Could not save session state: {e}")
+
+    def _open_activity_feed(self, activity_url: str):
+        """Load an activity feed in the headless context and wait for its posts.
+        
+        The session is exported again afterwards, so cookies LinkedIn refreshed
+        during headless runs are kept in storage_state_path. If the exported
+        session was rejected, it is dropped and the feed retried once with the
+        persistent profile, which may still be signed in.
+        
+        Raises:
+            PermissionError: If the feed redirects to the login page.
+        """
+        for attempt in range(2):
+            self._ensure_context(headless=True, block_assets=True)
+            self._page.goto(activity_url, wait_until="domcontentloaded", timeout=30000)
+            self._wait_for_selector(_FEED_READY_SELECTOR)
+            if "login" not in self._page.url or self._browser is None or attempt:
+                break
+            logger.info("Exported session was rejected; retrying with the browser profile")
+            self.close()
+            try:
+                os.remove(self.storage_state_path)
+            except OSError as e:
+                logger.warning(f"Could not remove expired session state: {e}")
+
+        # Check if we're redirected to login
+        if "login" in self._page.url:
+            raise PermissionError("Not logged in. Please log in to LinkedIn first.")
+        if self._context is not None:
+            self._save_storage_state()
+
+    def _ensure_context(self, headless: bool = False, block_assets: bool = False):
+        """Create or reuse a browser context.
+        
+        Headless contexts are created from the exported session
+        (storage_state_path) in a plain Chromium when it exists, which avoids
+        locking and loading the persistent profile. Otherwise, and for visible
+        windows, the persistent profile is used.
+        
+        Args:
+            headless: Launch the browser without a window.
+            block_assets: Abort images, stylesheets, fonts and other media
+                (see BLOCKED_RESOURCE_TYPES). Leave off for pages the user sees.
+        """
+        mode = (headless, block_assets)
+        if self._context is not None:
+            if self._context_mode == mode and not self._page.is_closed():
+                return
+            # Different launch options (or a dead page): start over
+            self.close()
         self._playwright = sync_playwright().start()
-        self._context = self._playwright.chromium.launch_persistent_context(
-            user_data_dir=self.browser_state_dir,
-            headless=headless,
-            viewport={"width": 1280, "height": 900},
-            args=["--disable-blink-features=AutomationControlled"],
-        )
+        viewport = self.HEADLESS_VIEWPORT if headless else self.WINDOW_VIEWPORT
+        args = list(self.BROWSER_ARGS + (self.BLOCKED_ASSET_ARGS if block_assets else ()))
+        if headless and os.path.isfile(self.storage_state_path):
+            self._browser = self._playwright.chromium.launch(headless=True, args=args)
+            self._context = self._browser.new_context(
+                storage_state=self.storage_state_path,
+                viewport=viewport,
+                device_scale_factor=1,
+            )
+        else:
+            self._context = self._playwright.chromium.launch_persistent_context(
+                user_data_dir=self.browser_state_dir,
+                headless=headless,
+                viewport=viewport,
+                device_scale_factor=1,
+                args=args,
+            )
+        if block_assets:
+            self._context.route("**/*", self._block_heavy_assets)
+            self._context.on("response", self._capture_voyager)
+        self._context.on("request", self._track_feed_request)
+        self._context.on("requestfinished", self._untrack_feed_request)
+        self._context.on("requestfailed", self._untrack_feed_request)
         self._page = self._context.pages[0] if self._context.pages else self._context.new_page()
+        self._post_locator = self._page.locator(_SELECTORS["post"])
+        self._context_mode = mode
 
+    @_on_browser_thread
     def close(self, on_status=None):
         """Close browser and cleanup."""
         if on_status:
@@ -77,6 +557,16 @@ class LinkedInScraper:
                     on_status(f"Warning: Error closing context: {e}")
             self._context = None
             self._page = None
+            self._post_locator = None
+            self._context_mode = None
+            self._feed_requests.clear()
+        if self._browser:
+            try:
+                self._browser.close()
+            except Exception as e:
+                if on_status:
+                    on_status(f"Warning: Error closing browser: {e}")
+            self._browser = None
         if self._playwright:
             try:
                 self._playwright.stop()
@@ -84,10 +574,15 @@ class LinkedInScraper:
                 if on_status:
                     on_status(f"Warning: Error stopping playwright: {e}")
             self._playwright = None
+        if self._io_pool:
+            # Queued debug snapshot writes still finish on the worker thread
+            self._io_pool.shutdown(wait=False)
+            self._io_pool = None
         
         if on_status:
             on_status("Browser closed.")
 
+    @_on_browser_thread
     def open_login(self, on_status=None) -> Optional[str]:
         """Open LinkedIn login page for user to authenticate manually.
         
@@ -105,12 +600,19 @@ class LinkedInScraper:
         if on_status:
             on_status("Please log in to LinkedIn in the browser window.")
 
-        # Wait for the user to log in — we detect it by checking for the feed page
+        # Wait for the user to log in — we detect it by the first navigation to a
+        # signed-in page (feed, network or a profile). wait_for_url reacts to the
+        # page's navigation events (as soon as the navigation commits) and also
+        # accepts the current URL if LinkedIn already redirected there.
         profile_url = None
         login_successful = False
         
         try:
-            self._page.wait_for_url("**/feed/**", timeout=300_000)  # 5 min timeout
+            self._page.wait_for_url(
+                lambda url: _is_logged_in_url(url, extra_paths=("/in",)),
+                wait_until="commit",
+                timeout=300_000,  # 5 min timeout
+            )
             login_successful = True
             
             if on_status:
@@ -121,9 +623,7 @@ class LinkedInScraper:
             
         except Exception as e:
             # User might have navigated elsewhere after login, check if logged in
-            current_url = self._page.url
-            
-            if "feed" in current_url or "mynetwork" in current_url or "in/" in current_url:
+            if _is_logged_in_url(self._page.url, extra_paths=("/in",)):
                 login_successful = True
                 
                 if on_status:
@@ -142,6 +642,8 @@ class LinkedInScraper:
         # Only close the browser after we've attempted to extract the profile URL
         # or if login clearly failed
         if login_successful or profile_url:
+            # Headless checks and scans start from this export
+            self._save_storage_state()
             if on_status:
                 if profile_url:
                     on_status(f"✓ Login complete! Profile: {profile_url}")
@@ -168,53 +670,29 @@ class LinkedInScraper:
             if on_status:
                 on_status("Extracting profile URL...")
             
-            # Wait for the URL to stabilize (LinkedIn might do redirects)
-            # Quick check with minimal delays for better UX
-            stable_url = None
-            for attempt in range(3):  # Reduced from 5 to 3 attempts
-                current_url = self._page.url
-                
-                # Check if we have a valid profile URL
-                if "/in/" in current_url:
-                    # Extract the part after /in/
-                    parts = current_url.split("/in/")
-                    if len(parts) > 1:
-                        # Get username (everything before ?, #, or next /)
-                        username_part = parts[1].split("?")[0].split("#")[0].split("/")[0]
-                        
-                        # Check if we have a valid username (not empty)
-                        if len(username_part) > 0:
-                            # Quick stability check (reduced from 1s to 0.3s)
-                            time.sleep(0.3)
-                            next_url = self._page.url
-                            
-                            if current_url == next_url:
-                                # URL is stable
-                                stable_url = current_url
-                                break
-                
-                # Still redirecting, wait a bit (reduced from 1s to 0.5s)
-                if attempt < 2:  # Don't wait on last attempt
-                    time.sleep(0.5)
-            
-            if not stable_url:
+            # Wait for LinkedIn's redirect to the member's own profile (/in/<username>)
+            # instead of polling the URL with fixed sleeps
+            try:
+                self._page.wait_for_url(
+                    lambda url: _PROFILE_URL_RE.match(url) is not None,
+                    wait_until="domcontentloaded",
+                    timeout=5000,
+                )
+            except PlaywrightTimeoutError:
                 if on_status:
                     on_status("Profile page did not load properly. You can enter the URL manually.")
                 return None
+            stable_url = self._page.url
             
-            # Extract the profile URL (remove any query parameters or fragments)
-            if "/in/" in stable_url:
-                # Match the profile URL pattern
-                match = re.match(r"(https://www\.linkedin\.com/in/[^/?#]+)", stable_url)
-                if match:
-                    profile_url = match.group(1) + "/"
-                    
-                    # Verify the URL is valid before returning
-                    if len(profile_url) > len("https://www.linkedin.com/in/"):
-                        logger.debug("Extracted profile URL: %s", profile_url)
-                        if on_status:
-                            on_status(f"✓ Profile URL extracted: {profile_url}")
-                        return profile_url
+            # Keep only the base profile URL (drop sub-pages, query parameters or
+            # fragments); the pattern requires a non-empty username
+            match = _PROFILE_URL_RE.match(stable_url)
+            if match:
+                profile_url = match.group(1) + "/"
+                logger.debug("Extracted profile URL: %s", profile_url)
+                if on_status:
+                    on_status(f"✓ Profile URL extracted: {profile_url}")
+                return profile_url
             
             logger.debug("Could not extract valid profile URL from: %s", stable_url)
             if on_status:
@@ -226,49 +704,43 @@ class LinkedInScraper:
                 on_status(f"Error extracting profile URL: {str(e)}")
             return None
 
+    @_on_browser_thread
     def is_logged_in(self) -> bool:
         """Check if we have a saved session by attempting to load LinkedIn."""
         try:
-            self._ensure_context(headless=True)
+            self._ensure_context(headless=True, block_assets=True)
             self._page.goto("https://www.linkedin.com/feed/", wait_until="domcontentloaded", timeout=15000)
-            self._human_delay(self.DELAY_AFTER_LOAD)
-            logged_in = "feed" in self._page.url and "login" not in self._page.url
-            self.close()
+            if "login" not in self._page.url:
+                # Wait for the feed (or a late client-side bounce to the login form)
+                self._wait_for_selector(_HOME_FEED_READY_SELECTOR, timeout=10000)
+            logged_in = _is_logged_in_url(self._page.url)
+            if logged_in and self._browser is None:
+                # Session from before the export existed: export it for later runs
+                self._save_storage_state()
             return logged_in
         except Exception:
             self.close()
             return False
 
+    @_on_browser_thread
     def check_profile_exists(self, profile_url: str) -> bool:
         """Check if a LinkedIn profile URL is reachable and valid."""
         try:
-            self._ensure_context(headless=True)
+            self._ensure_context(headless=True, block_assets=True)
             self._page.goto(profile_url, wait_until="domcontentloaded", timeout=15000)
             
-            # 1. Check if we got redirected to auth wall (login challenge)
-            if "authwall" in self._page.url or "login" in self._page.url:
-                # Redirected to login/authwall, so we cannot access the profile content.
-                # Treat this as "profile not reachable" for the purposes of this check.
-                self.close()
-                return False
-
-            # 1b. Check for explicit 404 redirect
-            if "/404/" in self._page.url:
-                self.close()
+            # 1. Check for a redirect to the auth wall / login (we cannot access the
+            # profile content, so treat it as "not reachable") or to the 404 page
+            if _is_unavailable_profile_url(self._page.url):
                 return False
 
             # 2. Check page title and content for 404-like messages
             # LinkedIn 404 pages often have "Page not found" or "Profile not available"
-            title = self._page.title()
-            content = self._page.content()
-            
-            if "Page not found" in title or "profile is not available" in content:
-                self.close()
+            if self._page.evaluate(_PROFILE_UNAVAILABLE_JS):
                 return False
             
             # 3. If we are on a profile page, it usually contains "LinkedIn" in title and the name
             # or the URL matches
-            self.close()
             return True
 
         except Exception as e:
@@ -301,7 +773,7 @@ class LinkedInScraper:
         
         # Extract the base profile URL (everything up to and including the username)
         # This handles URLs with or without trailing paths
-        match = re.match(r"(https://(?:www\.)?linkedin\.com/in/[^/?#]+)", profile_url)
+        match = _PROFILE_BASE_RE.match(profile_url)
         if match:
             base_url = match.group(1)
             return f"{base_url}/recent-activity/all/"
@@ -318,6 +790,7 @@ class LinkedInScraper:
         last_height = self._page.evaluate("document.body.scrollHeight")
         scrolls = 0
         no_change_count = 0
+        feed_wait_rounds = 0
 
         while True:
             # Check for cancellation
@@ -326,14 +799,25 @@ class LinkedInScraper:
                     on_status("Operation cancelled by user.")
                 break
 
-            self._page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            self._human_delay(self.DELAY_BETWEEN_SCROLLS)  # Human-like random delay
-            new_height = self._page.evaluate("document.body.scrollHeight")
-
-            if new_height == last_height:
-                no_change_count += 1
+            if self.USE_SCROLL_POLLING:
+                self._page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                self._human_delay(self.DELAY_BETWEEN_SCROLLS)  # Human-like random delay
+                new_height = self._page.evaluate("document.body.scrollHeight")
             else:
+                # Random quiet period keeps the scroll rhythm human-like
+                new_height = self._page.evaluate(_SCROLL_AND_WAIT_JS, {
+                    "idleMs": random.randint(*self.SCROLL_IDLE_MS),
+                    "maxMs": self.SCROLL_MAX_WAIT_MS,
+                })
+
+            if new_height != last_height:
                 no_change_count = 0
+                feed_wait_rounds = 0
+            elif self._feed_requests and feed_wait_rounds < self.MAX_FEED_WAIT_ROUNDS:
+                # The next page of posts is still loading: keep waiting for it
+                feed_wait_rounds += 1
+            else:
+                no_change_count += 1
 
             if no_change_count >= self.MAX_NO_CHANGE:
                 break
@@ -345,55 +829,78 @@ class LinkedInScraper:
             scrolls += 1
 
             # Determine if we should stop based on finding enough posts
+            # (on_scroll runs even without on_status; it may also collect posts)
             stop_scrolling = False
+            msg = f"Scrolling... ({scrolls} scrolls)"
+            if on_scroll:
+                try:
+                    # on_scroll might return a status string OR True if we should stop
+                    result = on_scroll(scrolls)
+                    if result is True:
+                        stop_scrolling = True
+                    elif result:
+                        msg = f"{msg} | {result}"
+                except Exception as exc:
+                    # Callback error should not stop scrolling
+                    logger.warning("Error in on_scroll callback at scroll %d: %s", scrolls, exc)
             if on_status:
-                msg = f"Scrolling... ({scrolls} scrolls)"
-                if on_scroll:
-                    try:
-                        # on_scroll might return a status string OR True if we should stop
-                        result = on_scroll(scrolls)
-                        if result is True:
-                            stop_scrolling = True
-                        elif result:
-                            msg = f"{msg} | {result}"
-                    except Exception as exc:
-                        # Callback error should not stop scrolling
-                        logger.warning("Error in on_scroll callback at scroll %d: %s", scrolls, exc)
                 on_status(msg)
             
             if stop_scrolling:
                 break
 
-    def scan_posts(self, profile_url: str, on_status=None, should_stop=None, on_data_count=None) -> list[PostPreview]:
+    @_on_browser_thread
+    def scan_posts(
+        self,
+        profile_url: str,
+        on_status=None,
+        should_stop=None,
+        on_data_count=None,
+        capture_html: bool = True,
+    ) -> list[PostPreview]:
         """Phase 1: Scan the feed and return a list of post previews with dates and headlines.
         
+        With ``capture_html`` the full HTML of every post is kept as well, so a
+        following ``scrape_posts`` for the same profile needs no second scroll.
+        
         Returns posts in the order they appear on the page (newest first).
         """
         activity_url = self._build_activity_url(profile_url)
+        self._last_scan = []
+        self._last_scan_url = None
+        self._voyager_posts.clear()
 
         if on_status:
             on_status(f"Navigating to {activity_url}")
 
-        self._ensure_context(headless=True)
-        self._page.goto(activity_url, wait_until="domcontentloaded", timeout=30000)
-        time.sleep(3)
-
-        # Check if we're redirected to login
-        if "login" in self._page.url:
-            self.close()
-            raise PermissionError("Not logged in. Please log in to LinkedIn first.")
+        self._open_activity_feed(activity_url)
         
         # Check for cancellation
         if should_stop and should_stop():
-            self.close()
             return []
 
         if on_status:
             on_status("Page loaded. Scrolling to load all posts...")
 
+        # Previews keyed by URN in page order, drained as the feed grows so no
+        # single call has to serialize the whole feed
+        scanned: dict[str, dict] = {}
+
+        def drain_new_posts():
+            new_posts = self._post_locator.evaluate_all(_DRAIN_POSTS_JS, {
+                "selectors": _SELECTORS,
+                "captureHtml": capture_html,
+                "seen": list(scanned),
+            })
+            for p in new_posts:
+                if p["elementId"] not in scanned:
+                    p["index"] = len(scanned)
+                    scanned[p["elementId"]] = p
+
         def get_scan_status(scrolls):
             try:
-                count = self._page.evaluate("document.querySelectorAll('div.feed-shared-update-v2[data-urn*=\"activity\"]').length")
+                drain_new_posts()
+                count = len(scanned)
                 if on_data_count:
                     on_data_count(count)
                 return f"Found {count} posts"
@@ -401,82 +908,45 @@ class LinkedInScraper:
                 # Query evaluation failed, return empty status
                 return ""
 
+        get_scan_status(0)
         self._scroll_feed(on_status=on_status, should_stop=should_stop, on_scroll=get_scan_status)
         
         # Check for cancellation before extraction
         if should_stop and should_stop():
-            self.close()
             return []
 
         if on_status:
             on_status("Extracting post previews...")
 
-        # Save debug HTML snapshot
-        try:
-            import os
-            debug_dir = os.path.join(os.path.dirname(self.browser_state_dir), "debug")
-            os.makedirs(debug_dir, exist_ok=True)
-            debug_file = os.path.join(debug_dir, "linkedin_page.html")
-            html_content = self._page.content()
-            with open(debug_file, "w", encoding="utf-8") as f:
-                f.write(html_content)
-            logger.info(f"Saved debug HTML to {debug_file}")
-            if on_status:
-                on_status(f"Debug: Saved page HTML to {debug_file}")
-        except Exception as e:
-            logger.warning(f"Could not save debug HTML: {e}")
+        if self.debug_snapshot:
+            self._save_debug_snapshot(on_status)
 
-        # Extract post previews using JavaScript for speed
-        previews_data = self._page.evaluate("""
-            () => {
-                const posts = document.querySelectorAll('div.feed-shared-update-v2[data-urn*="activity"]');
-                const results = [];
-                posts.forEach((post, idx) => {
-                    const urn = post.getAttribute('data-urn') || '';
-
-                    // Get date text
-                    const timeEl = post.querySelector('.update-components-actor__sub-description span.visually-hidden');
-                    const dateText = timeEl ? timeEl.textContent.trim() : '';
-
-                    // Get headline / first line of post content
-                    const contentEl = post.querySelector('.feed-shared-update-v2__description .update-components-text');
-                    let headline = '';
-                    if (contentEl) {
-                        headline = contentEl.textContent.trim().substring(0, 120);
-                    }
-                    // Fallback: try commentary
-                    if (!headline) {
-                        const commentaryEl = post.querySelector('.feed-shared-update-v2__commentary');
-                        if (commentaryEl) {
-                            headline = commentaryEl.textContent.trim().substring(0, 120);
-                        }
-                    }
-                    // Fallback: try update-components-text directly
-                    if (!headline) {
-                        const anyText = post.querySelector('.update-components-text');
-                        if (anyText) {
-                            headline = anyText.textContent.trim().substring(0, 120);
-                        }
-                    }
-
-                    results.push({
-                        index: idx,
-                        dateText: dateText,
-                        headline: headline || '(No text content)',
-                        elementId: urn
-                    });
-                });
-                return results;
-            }
-        """)
+        # Pick up whatever the last scroll revealed
+        drain_new_posts()
+        previews_data = list(scanned.values())
+
+        if capture_html:
+            self._last_scan = [
+                {"html": p["html"], "dateText": p["dateText"], "elementId": p["elementId"]}
+                for p in previews_data
+            ]
+            self._last_scan_url = activity_url
+        elif previews_data and self._voyager_posts:
+            # Previews only: prefer the feed's own API data, matched to the page by URN
+            previews_data = self._voyager_previews(scanned)
+
+        if not previews_data and self._voyager_posts:
+            # Selectors matched nothing (LinkedIn markup changed?); fall back to API data
+            logger.info("No posts matched the DOM selectors; using captured API responses")
+            previews_data = self._voyager_previews()
 
         logger.info(f"Extracted {len(previews_data)} post previews")
         
         if not previews_data:
+            if not self.debug_snapshot:
+                self._save_debug_snapshot(on_status)
             if on_status:
                 on_status("⚠ No posts found. Check the debug HTML file for the page structure.")
-        
-        self.close()
 
         return [
             PostPreview(
@@ -488,50 +958,111 @@ class LinkedInScraper:
             for p in previews_data
         ]
 
-    def scrape_posts(
-        self,
-        profile_url: str,
-        start_index: int = 0,
-        max_posts: int = 50,
-        on_status=None,
-        on_progress=None,
-        should_stop=None,
-        on_data_count=None,
-    ) -> list[RawPost]:
-        """Phase 2: Scrape full post content starting from a given index.
+    @_on_browser_thread
+    def _export_storage_state(self) -> dict:
+        """Return the saved session's cookies and local storage from the persistent profile."""
+        self._ensure_context(headless=True, block_assets=True)
+        return self._context.storage_state()
+
+    def check_profiles(self, profile_urls: list[str], concurrency: int = 4) -> dict[str, bool]:
+        """Check several profile URLs concurrently in one headless Chromium.
         
-        Args:
-            profile_url: LinkedIn profile URL
-            start_index: Index of the oldest post to start from
-            max_posts: Maximum number of posts to scrape
-            on_status: Callback for status messages
-            on_progress: Callback for progress (current, total)
+        Same checks as ``check_profile_exists``, run in up to ``concurrency``
+        isolated contexts driven with Playwright's async API on a private event
+        loop. Each context is seeded with the logged-in session copied from the
+        persistent profile.
         
-        Returns posts ordered from oldest to newest.
+        Returns:
+            Dict mapping each profile URL to whether it is reachable and valid
+            (False if its check failed; the other URLs are still checked).
         """
-        activity_url = self._build_activity_url(profile_url)
+        storage_state = self._export_storage_state()
+        results = asyncio.run(
+            self._run_in_contexts(profile_urls, storage_state, concurrency, self._check_in_context)
+        )
+        for url, result in results.items():
+            if isinstance(result, Exception):
+                logger.warning(f"Error checking if profile exists: {result}")
+                results[url] = False
+        return results
+
+    async def _run_in_contexts(self, profile_urls: list[str], storage_state: dict, concurrency: int, job) -> dict:
+        """Await job(context, url) for every profile, at most ``concurrency`` at a time.
+        
+        Each profile gets a fresh context, closed when its job finishes. A
+        failing job does not cancel the others: its exception is returned as
+        that profile's result.
+        """
+        async def block_heavy_assets(route):
+            if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+                await route.abort()
+            else:
+                await route.continue_()
 
+        slots = asyncio.Semaphore(max(1, concurrency))
+
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(
+                headless=True,
+                args=list(self.BROWSER_ARGS + self.BLOCKED_ASSET_ARGS),
+            )
+            try:
+                async def run_one(profile_url):
+                    async with slots:
+                        context = await browser.new_context(
+                            storage_state=storage_state,
+                            viewport=self.HEADLESS_VIEWPORT,
+                            device_scale_factor=1,
+                        )
+                        try:
+                            await context.route("**/*", block_heavy_assets)
+                            return await job(context, profile_url)
+                        finally:
+                            await context.close()
+
+                results = await asyncio.gather(
+                    *(run_one(url) for url in profile_urls), return_exceptions=True
+                )
+            finally:
+                await browser.close()
+
+        return dict(zip(profile_urls, results))
+
+    async def _check_in_context(self, context, profile_url: str) -> bool:
+        """Async counterpart of check_profile_exists in its own page."""
+        try:
+            page = await context.new_page()
+            await page.goto(profile_url, wait_until="domcontentloaded", timeout=15000)
+            if _is_unavailable_profile_url(page.url):
+                return False
+            return not await page.evaluate(_PROFILE_UNAVAILABLE_JS)
+        except Exception as e:
+            logger.warning(f"Error checking if profile exists: {e}")
+            return False
+
+    @_on_browser_thread
+    def _load_feed(
+        self, activity_url: str, start_index: int, on_status=None, should_stop=None, on_data_count=None
+    ) -> Optional[list[int]]:
+        """Open the activity feed and scroll until post start_index is loaded.
+        
+        Returns the DOM positions of the distinct loaded posts (so that post
+        ``i`` is at ``positions[i]``), or None if the operation was cancelled.
+        """
         if on_status:
             on_status(f"Navigating to {activity_url}")
 
-        self._ensure_context(headless=True)
-        self._page.goto(activity_url, wait_until="domcontentloaded", timeout=30000)
-        time.sleep(3)
-
-        if "login" in self._page.url:
-            self.close()
-            raise PermissionError("Not logged in. Please log in to LinkedIn first.")
+        self._open_activity_feed(activity_url)
 
         if should_stop and should_stop():
-            self.close()
-            return []
+            return None
 
         if on_status:
             on_status("Scrolling to load posts...")
 
         def get_scrape_status(scrolls):
             try:
-                count = self._page.evaluate("document.querySelectorAll('div.feed-shared-update-v2[data-urn*=\"activity\"]').length")
+                count = self._post_locator.evaluate_all(_COUNT_POSTS_JS)
                 
                 # Check if we have enough posts (reached start_index)
                 if count > start_index:
@@ -551,50 +1082,120 @@ class LinkedInScraper:
         self._scroll_feed(on_status=on_status, should_stop=should_stop, on_scroll=get_scrape_status)
 
         if should_stop and should_stop():
-            self.close()
-            return []
+            return None
 
-        if on_status:
-            on_status("Extracting post content...")
-
-        # Extract full post HTML and metadata
-        posts_data = self._page.evaluate("""
-            (startIndex) => {
-                const posts = document.querySelectorAll('div.feed-shared-update-v2[data-urn*="activity"]');
-                const results = [];
-                // Actually, get all posts from startIndex down to 0 (oldest to newest on page = reversed)
-                const subset = Array.from(posts).slice(0, startIndex + 1);
-                subset.forEach((post, idx) => {
-                    const urn = post.getAttribute('data-urn') || '';
-                    const timeEl = post.querySelector('.update-components-actor__sub-description span.visually-hidden');
-                    const dateText = timeEl ? timeEl.textContent.trim() : '';
-                    results.push({
-                        html: post.outerHTML,
-                        dateText: dateText,
-                        elementId: urn,
-                        index: idx
-                    });
-                });
-                return results;
-            }
-        """, start_index)
+        return self._post_locator.evaluate_all(_UNIQUE_POST_POSITIONS_JS)
 
-        self.close()
+    @_on_browser_thread
+    def _extract_post(self, position: int) -> dict:
+        """Return html/dateText/elementId of the post element at a DOM position."""
+        post = self._post_locator.nth(position)
+        return post.evaluate(_POST_DATA_JS, _SELECTORS["date"])
 
-        # Reverse to get oldest first
-        raw_posts = [
-            RawPost(
-                html=p["html"],
-                date_text=p["dateText"],
-                element_id=p["elementId"],
-                index=p["index"]
+    @_on_browser_thread
+    def _reread_post(self, urn: str) -> Optional[dict]:
+        """Return fresh html/dateText/elementId of the loaded post with this URN.
+        
+        None if the page no longer holds it (or cannot be read).
+        """
+        if self._post_locator is None or not urn:
+            return None
+        try:
+            return self._post_locator.evaluate_all(
+                _POST_BY_URN_JS, {"urn": urn, "dateSel": _SELECTORS["date"]}
             )
-            for p in reversed(posts_data)
-        ]
+        except Exception as e:
+            logger.debug("Could not re-read post %s: %s", urn, e)
+            return None
+
+    def iter_posts(
+        self,
+        profile_url: str,
+        start_index: int = 0,
+        max_posts: int = 50,
+        on_status=None,
+        should_stop=None,
+        on_data_count=None,
+    ) -> Iterator[RawPost]:
+        """Phase 2: Yield full posts from start_index towards the newest, one at a time.
+        
+        Posts come from the last scan of the same profile when it covers
+        start_index (re-read from the page if it is still loaded, as a post may
+        have finished rendering after the scan first saw it); otherwise the feed is loaded and each post's HTML is pulled
+        from the page only when the caller asks for it, so at most one raw post
+        needs to be held in memory.
+        
+        Args:
+            profile_url: LinkedIn profile URL
+            start_index: Index of the oldest post to start from
+            max_posts: Maximum number of posts to yield (0 or None for no limit)
+            on_status: Callback for status messages
+        
+        Yields posts ordered from oldest to newest.
+        """
+        activity_url = self._build_activity_url(profile_url)
+
+        from_scan = self._last_scan_url == activity_url and start_index < len(self._last_scan)
+        if from_scan:
+            count = len(self._last_scan)
+            if on_status:
+                on_status("Using posts from the last scan")
+        else:
+            positions = self._load_feed(activity_url, start_index, on_status, should_stop, on_data_count)
+            if not positions:
+                return
+            count = len(positions)
+            if on_status:
+                on_status("Extracting post content...")
 
-        # Limit to max_posts if provided; selection-based filtering (if any) happens earlier
-        if max_posts is not None and max_posts > 0:
-            raw_posts = raw_posts[:max_posts]
+        first = min(start_index, count - 1)
+        last = max(-1, first - max_posts) if max_posts is not None and max_posts > 0 else -1
+        for index in range(first, last, -1):
+            if should_stop and should_stop():
+                return
+            if from_scan:
+                data = self._last_scan[index]
+                data = self._reread_post(data["elementId"]) or data
+            else:
+                data = self._extract_post(positions[index])
+            yield RawPost(
+                html=data["html"],
+                date_text=data["dateText"],
+                element_id=data["elementId"],
+                index=index,
+            )
+
+    def scrape_posts(
+        self,
+        profile_url: str,
+        start_index: int = 0,
+        max_posts: int = 50,
+        on_status=None,
+        on_progress=None,
+        should_stop=None,
+        on_data_count=None,
+    ) -> list[RawPost]:
+        """Phase 2: Scrape full post content starting from a given index.
+        
+        List-returning wrapper around ``iter_posts``.
+        
+        Args:
+            profile_url: LinkedIn profile URL
+            start_index: Index of the oldest post to start from
+            max_posts: Maximum number of posts to scrape
+            on_status: Callback for status messages
+            on_progress: Callback for progress (current, total)
+        
+        Returns posts ordered from oldest to newest.
+        """
+        raw_posts = list(self.iter_posts(
+            profile_url,
+            start_index=start_index,
+            max_posts=max_posts,
+            on_status=on_status,
+            should_stop=should_stop,
+            on_data_count=on_data_count,
+        ))
 
         total = len(raw_posts)
         if on_progress:
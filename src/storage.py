@@ -1,9 +1,12 @@
 """Storage module for saving LinkedIn posts as markdown files."""
 
+import io
 import os
 import re
 import logging
-from typing import Optional
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import Iterable, Optional, Sized
 from slugify import slugify
 from datetime import datetime
 
@@ -11,15 +14,34 @@ from .parser import Post
 
 logger = logging.getLogger(__name__)
 
+# "source:" line of a saved post's frontmatter
+_FRONTMATTER_URL_RE = re.compile(r"^source:[ \t]*(\S+)", re.M)
+# First lines slugify would only lower-case and hyphenate (ASCII letters,
+# digits, spaces and hyphens); their slug is built without slugify
+_SIMPLE_SLUG_RE = re.compile(r"[A-Za-z0-9 -]+")
+_SLUG_SEPARATOR_RE = re.compile(r"[ -]+")
+
+# Frontmatter up to the optional media_type line (see _post_to_markdown)
+_FRONTMATTER_TPL = "---\nauthor: {author}\ndate: {date}\nsource: {url}\n"
+
+# Threads writing post files in save_posts (a few small blocking writes each)
+_SAVE_WORKERS = 4
+
+# YYYY-MM-DD date prefix of a post filename
+_FILENAME_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
 
 def _make_slug(text: str, max_length: int = 50) -> str:
     """Create a URL-safe slug from text."""
     if not text:
         return "post"
     # Take first line only
-    first_line = text.split("\n")[0].strip()
+    first_line = text.partition("\n")[0].strip()
     # Truncate before slugifying
     truncated = first_line[:max_length]
+    if _SIMPLE_SLUG_RE.fullmatch(truncated):
+        # Same result as slugify for plain ASCII text, at a fraction of the cost
+        return _SLUG_SEPARATOR_RE.sub("-", truncated.lower()).strip("-") or "post"
     slug = slugify(truncated, max_length=max_length)
     return slug or "post"
 
@@ -33,31 +55,19 @@ def _build_filename(post: Post) -> str:
 
 def _post_to_markdown(post: Post) -> str:
     """Convert a Post object to a markdown string with YAML frontmatter."""
-    lines = [
-        "---",
-        f"author: {post.author}",
-        f"date: {post.date}",
-        f"source: {post.post_url}",
-    ]
-
+    buf = io.StringIO()
+    buf.write(_FRONTMATTER_TPL.format(author=post.author, date=post.date, url=post.post_url))
     if post.media_type:
-        lines.append(f"media_type: {post.media_type}")
-
-    lines.append("---")
-    lines.append("")
+        buf.write(f"media_type: {post.media_type}\n")
+    buf.write("---\n\n")
 
     # Post content
-    if post.content:
-        lines.append(post.content)
-    else:
-        lines.append("*(No text content)*")
-
-    lines.append("")
+    buf.write(post.content or "*(No text content)*")
+    buf.write("\n\n")
 
     # Media link if present
     if post.media_link:
-        lines.append(f"**Media:** [{post.media_type or 'Link'}]({post.media_link})")
-        lines.append("")
+        buf.write(f"**Media:** [{post.media_type or 'Link'}]({post.media_link})\n\n")
 
     # Engagement footer
     engagement_parts = []
@@ -69,17 +79,45 @@ def _post_to_markdown(post: Post) -> str:
         engagement_parts.append(f"Reposts: {post.reposts}")
 
     if engagement_parts:
-        lines.append("---")
-        lines.append(f"*{' | '.join(engagement_parts)}*")
+        buf.write(f"---\n*{' | '.join(engagement_parts)}*\n")
+
+    return buf.getvalue()
 
-    lines.append("")
-    return "\n".join(lines)
+
+def _index_folder(output_folder: str) -> tuple[set[str], set[str]]:
+    """Read a person's folder once for duplicate and filename checks.
+    
+    Returns:
+        The source URLs from the frontmatter of every post saved under
+        output_folder, and the names of the files directly in it.
+    """
+    index = set()
+    filenames = set()
+    for root, dirs, files in os.walk(output_folder):
+        if root == output_folder:
+            filenames.update(files)
+        for f in files:
+            if f.endswith(".md"):
+                try:
+                    with open(os.path.join(root, f), "r", encoding="utf-8") as fh:
+                        match = _FRONTMATTER_URL_RE.search(fh.read(500))
+                except Exception:
+                    continue
+                if match:
+                    index.add(match.group(1))
+    return index, filenames
 
 
-def _is_duplicate(output_folder: str, post: Post) -> bool:
-    """Check if a post has already been saved (matched by source URL in frontmatter)."""
+def _is_duplicate(output_folder: str, post: Post, url_index: Optional[set[str]] = None) -> bool:
+    """Check if a post has already been saved (matched by source URL in frontmatter).
+    
+    With a url_index (see _index_folder) this is a set lookup; without one
+    the output folder is scanned.
+    """
     if not post.post_url:
         return False
+    if url_index is not None:
+        return post.post_url in url_index
 
     # Walk the output folder and check frontmatter
     for root, dirs, files in os.walk(output_folder):
@@ -110,7 +148,7 @@ def get_latest_post_date(person_folder: str) -> Optional[str]:
         for f in files:
             if f.endswith(".md"):
                 # Extract date from filename (YYYY-MM-DD_...)
-                match = re.match(r"(\d{4}-\d{2}-\d{2})", f)
+                match = _FILENAME_DATE_RE.match(f)
                 if match:
                     file_date = match.group(1)
                     if latest_date is None or file_date > latest_date:
@@ -118,7 +156,24 @@ def get_latest_post_date(person_folder: str) -> Optional[str]:
     return latest_date
 
 
-def save_post(post: Post, output_folder: str, skip_duplicates: bool = True, forced_author: str = None) -> Optional[str]:
+def _person_folder(post: Post, output_folder: str, forced_author: str = None) -> str:
+    """Return the person-specific subfolder a post is saved in."""
+    if forced_author:
+        author_slug = slugify(forced_author)
+    else:
+        author_slug = slugify(post.author) if post.author else "unknown-author"
+    return os.path.join(output_folder, author_slug)
+
+
+def save_post(
+    post: Post,
+    output_folder: str,
+    skip_duplicates: bool = True,
+    forced_author: str = None,
+    url_index: Optional[set[str]] = None,
+    filenames: Optional[set[str]] = None,
+    filename: Optional[str] = None,
+) -> Optional[str]:
     """Save a single post as a markdown file.
     
     Args:
@@ -126,62 +181,151 @@ def save_post(post: Post, output_folder: str, skip_duplicates: bool = True, forc
         output_folder: Root output folder path
         skip_duplicates: If True, skip posts that already exist
         forced_author: Optional author name to force folder creation
+        url_index: Source URLs already saved in the person's folder (from
+            _index_folder); used for the duplicate check and updated
+            with the saved post. If None, the folder is scanned.
+        filenames: Names of the files in the person's folder (from
+            _index_folder); taken names are skipped without touching the
+            disk, and the new file's name is added.
+        filename: File name to save under (a suffix is still added if it is
+            taken); built from the post's date and text if None.
     
     Returns:
         Path to the saved file, or None if skipped.
     """
     # Create person-specific subfolder
-    if forced_author:
-        author_slug = slugify(forced_author)
-    else:
-        author_slug = slugify(post.author) if post.author else "unknown-author"
-    
-    person_folder = os.path.join(output_folder, author_slug)
+    person_folder = _person_folder(post, output_folder, forced_author)
     os.makedirs(person_folder, exist_ok=True)
 
-    if skip_duplicates and _is_duplicate(person_folder, post):
+    if skip_duplicates and _is_duplicate(person_folder, post, url_index):
         logger.info(f"Skipping duplicate post: {post.post_url}")
         return None
 
-    filename = _build_filename(post)
-    filepath = os.path.join(person_folder, filename)
-
-    # Handle filename collision
-    counter = 1
-    base, ext = os.path.splitext(filepath)
-    while os.path.exists(filepath):
-        filepath = f"{base}_{counter}{ext}"
-        counter += 1
-
+    if filename is None:
+        filename = _build_filename(post)
+    # Encode once and write bytes (newlines as text mode would write them)
     markdown_content = _post_to_markdown(post)
-
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(markdown_content)
+    if os.linesep != "\n":
+        markdown_content = markdown_content.replace("\n", os.linesep)
+    data = markdown_content.encode("utf-8")
+
+    # Write to a temporary file first, so the post file never appears half-written
+    fd, tmp_path = tempfile.mkstemp(dir=person_folder, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+
+        # Handle filename collision; names known to be taken are skipped in memory,
+        # and exclusive creation claims the name atomically, so concurrent saves
+        # (or files the index does not know about) never get overwritten
+        counter = 1
+        base, ext = os.path.splitext(filename)
+        while True:
+            if filenames is None or filename not in filenames:
+                try:
+                    open(os.path.join(person_folder, filename), "xb").close()
+                    break
+                except FileExistsError:
+                    pass
+            filename = f"{base}_{counter}{ext}"
+            counter += 1
+        filepath = os.path.join(person_folder, filename)
+        if filenames is not None:
+            filenames.add(filename)
+
+        # Swap the complete file in over the claimed (empty) name
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    if url_index is not None and post.post_url:
+        url_index.add(post.post_url)
 
     logger.info(f"Saved post to {filepath}")
     return filepath
 
 
-def save_posts(posts: list[Post], output_folder: str, on_progress=None, forced_author: str = None) -> list[str]:
+def _reserve_filename(filename: str, filenames: set[str]) -> str:
+    """Return the first of filename, filename_1, ... not in filenames, and add it."""
+    counter = 1
+    base, ext = os.path.splitext(filename)
+    candidate = filename
+    while candidate in filenames:
+        candidate = f"{base}_{counter}{ext}"
+        counter += 1
+    filenames.add(candidate)
+    return candidate
+
+
+def save_posts(posts: Iterable[Post], output_folder: str, on_progress=None, forced_author: str = None) -> list[str]:
     """Save multiple posts as markdown files.
     
+    Files are written on a thread pool; duplicates and file names are resolved
+    up front, in the order of posts, so each source URL is written at most
+    once and colliding posts get the same suffixes on every run. ``posts`` may be any iterable
+    (e.g. a generator); it is consumed lazily, with at most a few posts per
+    worker waiting to be written.
+    
     Args:
-        posts: List of parsed Post objects
+        posts: Parsed Post objects
         output_folder: Root output folder path
-        on_progress: Callback (current, total, filepath)
+        on_progress: Callback (current, total, filepath), called from this thread
+            as each post finishes (in completion order); total is None when
+            posts has no length
         forced_author: Optional author name to force folder creation
     
     Returns:
-        List of saved file paths.
+        List of saved file paths, in the order of posts.
     """
-    saved = []
-    total = len(posts)
-
-    for i, post in enumerate(posts):
-        filepath = save_post(post, output_folder, forced_author=forced_author)
-        if filepath:
-            saved.append(filepath)
+    total = len(posts) if isinstance(posts, Sized) else None
+    saved: dict[int, str] = {}
+    # Saved source URLs and file names per person folder, read once instead
+    # of once per post
+    folder_indexes: dict[str, tuple[set[str], set[str]]] = {}
+    pending = {}  # Future -> position in posts
+    done = 0
+
+    def report(filepath):
+        nonlocal done
+        done += 1
         if on_progress:
-            on_progress(i + 1, total, filepath)
-
-    return saved
+            on_progress(done, total, filepath)
+
+    def collect(futures):
+        for future in futures:
+            filepath = future.result()
+            position = pending.pop(future)
+            if filepath:
+                saved[position] = filepath
+            report(filepath)
+
+    with ThreadPoolExecutor(max_workers=_SAVE_WORKERS, thread_name_prefix="save-post") as pool:
+        for i, post in enumerate(posts):
+            person_folder = _person_folder(post, output_folder, forced_author)
+            if person_folder not in folder_indexes:
+                folder_indexes[person_folder] = _index_folder(person_folder)
+            url_index, filenames = folder_indexes[person_folder]
+            if post.post_url and post.post_url in url_index:
+                logger.info(f"Skipping duplicate post: {post.post_url}")
+                report(None)
+                continue
+            if post.post_url:
+                url_index.add(post.post_url)  # Claim it before a later copy is submitted
+            filename = _reserve_filename(_build_filename(post), filenames)
+            future = pool.submit(
+                save_post, post, output_folder,
+                skip_duplicates=False, forced_author=forced_author, filename=filename,
+            )
+            pending[future] = i
+            if len(pending) >= 2 * _SAVE_WORKERS:
+                # Keep the backlog bounded instead of draining the whole iterable
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(finished)
+
+        collect(as_completed(list(pending)))
+
+    return [saved[position] for position in sorted(saved)]
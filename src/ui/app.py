@@ -7,6 +7,21 @@ from .browse_frame import BrowseFrame
 from .settings_dialog import SettingsDialog
 from ..config import load_config, save_config, get_appearance_mode
 
+# Widgets that keep focus when clicked (see App._on_global_click)
+_ENTRY_CLASSES = (ctk.CTkEntry, ctk.CTkTextbox)
+_INPUT_CLASSES = frozenset({"entry", "text", "tentry", "ttext"})
+
+_ABOUT_TEXT = (
+    "LinkedIn Post Scraper v1.3.0\n\n"
+    "A tool for archiving LinkedIn posts as markdown files.\n\n"
+    "Co-created by:\n"
+    "• Google Antigravity (AI Agent)\n"
+    "• Anthropic Claude Opus 4.6 & Sonnet 4.5\n"
+    "• Google Gemini 3.0\n\n"
+    "Licensed under MIT License\n\n"
+    "https://github.com/tradmangh/LinkedIn-PostScraper"
+)
+
 
 class App(ctk.CTk):
     """Main application window."""
@@ -98,8 +113,10 @@ class App(ctk.CTk):
         self.scrape_frame = ScrapeFrame(self.scrape_tab, self.config_data)
         self.scrape_frame.grid(row=0, column=0, sticky="nsew")
 
-        self.browse_frame = BrowseFrame(self.browse_tab, self.config_data)
-        self.browse_frame.grid(row=0, column=0, sticky="nsew")
+        # Browse tab is built the first time it is opened (see _on_tab_change)
+        self.browse_frame = None
+        self._browse_placeholder = ctk.CTkLabel(self.browse_tab, text="Loading…", text_color="gray")
+        self._browse_placeholder.grid(row=0, column=0)
 
         # Save config on close
         self.protocol("WM_DELETE_WINDOW", self._on_close)
@@ -110,6 +127,7 @@ class App(ctk.CTk):
 
     def _on_close(self):
         save_config(self.config_data)
+        self.scrape_frame.close_browser()
         self.destroy()
 
     def _on_ctrl_f(self, event=None):
@@ -118,13 +136,17 @@ class App(ctk.CTk):
         
         if current_tab == "Scrape":
             self.scrape_frame.focus_filter_entry()
-        elif current_tab == "Browse":
+        elif current_tab == "Browse" and self.browse_frame is not None:
             self.browse_frame.focus_filter_entry()
 
     def _on_tab_change(self):
         """Handle tab changes."""
         current_tab = self.tabview.get().strip()
         if current_tab == "Browse":
+            if self.browse_frame is None:
+                self._browse_placeholder.destroy()
+                self.browse_frame = BrowseFrame(self.browse_tab, self.config_data)
+                self.browse_frame.grid(row=0, column=0, sticky="nsew")
             # Auto-refresh files when switching to Browse tab
             self.browse_frame.refresh_files()
 
@@ -139,16 +161,19 @@ class App(ctk.CTk):
             # If widget is a string identifier (rare but possible in tk), ignore it or just return
             return
 
-        if not isinstance(widget, (ctk.CTkEntry, ctk.CTkTextbox)):
-            # Helper to check widget type properly for both tk and ctk
-            try:
-                w_class = widget.winfo_class().lower()
-            except AttributeError:
-                return
-            
-            # formatting: entry, text, etc. are input classes
-            if "entry" not in w_class and "text" not in w_class:
-                self.focus()
+        # Typing into a CTk entry is the common case: no Tk round trip needed
+        if isinstance(widget, _ENTRY_CLASSES):
+            return
+
+        # Helper to check widget type properly for both tk and ctk
+        try:
+            w_class = widget.winfo_class().lower()
+        except AttributeError:
+            return
+
+        # entry, text, etc. are input classes
+        if w_class not in _INPUT_CLASSES:
+            self.focus()
 
     def _show_settings(self):
         """Show Settings dialog."""
@@ -157,14 +182,4 @@ class App(ctk.CTk):
     def _show_about(self):
         """Show About dialog."""
         from tkinter import messagebox
-        messagebox.showinfo(
-            "About LinkedIn Post Scraper",
-            "LinkedIn Post Scraper v1.3.0\n\n"
-            "A tool for archiving LinkedIn posts as markdown files.\n\n"
-            "Co-created by:\n"
-            "• Google Antigravity (AI Agent)\n"
-            "• Anthropic Claude Opus 4.6 & Sonnet 4.5\n"
-            "• Google Gemini 3.0\n\n"
-            "Licensed under MIT License\n\n"
-            "https://github.com/tradmangh/LinkedIn-PostScraper"
-        )
+        messagebox.showinfo("About LinkedIn Post Scraper", _ABOUT_TEXT)
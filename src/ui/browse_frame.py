@@ -1,19 +1,57 @@
 """Browse tab — view saved markdown posts."""
 
 import os
+import logging
 import subprocess
+import threading
+from functools import lru_cache
+from typing import Iterator, Optional
 import customtkinter as ctk
 
 from ..config import get_output_folder
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=64)
+def _read_md(filepath: str, mtime_ns: int) -> str:
+    """Read a saved post; keyed by mtime so an edited file is read again."""
+    with open(filepath, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _scan_md_files(folder: str) -> Iterator[str]:
+    """Yield the paths of all markdown files under folder.
+
+    Like os.walk, unreadable folders are skipped and symlinked folders are not followed.
+    """
+    try:
+        entries = os.scandir(folder)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_md_files(entry.path)
+            elif entry.name.endswith(".md"):
+                yield entry.path
+
 
 class BrowseFrame(ctk.CTkFrame):
     """Frame for browsing saved posts."""
 
+    PAGE_SIZE = 200  # Buttons rendered at a time; "Show more" adds another page
+
     def __init__(self, parent, config: dict):
         super().__init__(parent, fg_color="transparent")
         self.config = config
         self.all_files = []  # Cache for filtering
+        self._rel_lower: list[str] = []  # Lower-cased relative paths, parallel to all_files
+        # output folder -> (folder signature, file list, lower-cased paths) of the last walk
+        # (only touched by the walk thread; one runs at a time)
+        self._walk_cache: dict[str, tuple[tuple, list, list]] = {}
+        self._walk_in_flight = False
+        self._walk_pending: Optional[bool] = None  # force flag of a refresh queued meanwhile
 
         self.grid_rowconfigure(2, weight=1)
         self.grid_columnconfigure(0, weight=1)
@@ -29,7 +67,7 @@ class BrowseFrame(ctk.CTkFrame):
             text="🔄 Refresh",
             width=100,
             height=32,
-            command=self._refresh_list,
+            command=lambda: self._refresh_list(force=True),
         )
         self.refresh_btn.grid(row=0, column=0, sticky="w")
 
@@ -82,8 +120,26 @@ class BrowseFrame(ctk.CTkFrame):
         self.file_list.grid(row=2, column=0, sticky="nsew", padx=(0, 8))
         self.file_list.grid_columnconfigure(0, weight=1)
 
+        # Pool of file buttons, reconfigured on every update (extra ones hidden)
         self.file_buttons: list[ctk.CTkButton] = []
+        self._file_font = ctk.CTkFont(size=11)
+        self._shown_buttons = 0  # Leading pooled buttons currently gridded
+        self._page_limit = self.PAGE_SIZE
+        self._show_more_btn = ctk.CTkButton(
+            self.file_list,
+            text="",
+            font=self._file_font,
+            height=28,
+            fg_color="transparent",
+            text_color=("gray40", "gray60"),
+            hover_color=("gray80", "gray30"),
+            command=self._show_more,
+        )
+        self._placeholder_label = ctk.CTkLabel(self.file_list, text="", text_color="gray")
         self._selected_file: str = ""
+        self._selected_mtime: int = 0  # mtime of the previewed file (0 = nothing loaded)
+        self._filter_after_id = None  # Pending debounced filter update
+        self._rendered: Optional[tuple] = None  # (filter text, all_files) shown by the list
 
         # --- Preview panel (right panel) ---
         self.preview_frame = ctk.CTkFrame(self)
@@ -107,49 +163,109 @@ class BrowseFrame(ctk.CTkFrame):
         )
         self.preview_text.grid(row=1, column=0, sticky="nsew", padx=12, pady=(0, 12))
 
-        # Initial load
-        self.after(500, self._refresh_list)
-
     def refresh_files(self):
         """Public method to refresh the file list."""
         self._refresh_list()
 
-    def _refresh_list(self):
-        """Reload the file list from the output folder and update UI."""
-        output_folder = get_output_folder(self.config)
-        self.all_files = []
+    @staticmethod
+    def _folder_signature(output_folder: str) -> tuple:
+        """Modification times of the output folder and its person folders.
+        
+        Posts are saved one level deep, so a new or removed post changes the
+        mtime of its person folder; the signature is unchanged otherwise.
+        """
+        with os.scandir(output_folder) as entries:
+            folders = sorted(
+                (entry.name, entry.stat().st_mtime_ns) for entry in entries if entry.is_dir()
+            )
+        return os.stat(output_folder).st_mtime_ns, tuple(folders)
 
-        if os.path.isdir(output_folder):
-            for root, dirs, files in os.walk(output_folder):
-                for f in sorted(files):
-                    if f.endswith(".md"):
-                        full_path = os.path.join(root, f)
-                        # Show relative path from output folder
-                        rel_path = os.path.relpath(full_path, output_folder)
-                        self.all_files.append((rel_path, full_path))
+    def _refresh_list(self, force: bool = False):
+        """Reload the file list from the output folder and update UI.
         
+        The folder is read on a background thread; the list is updated once
+        it is done. Refreshes requested meanwhile are coalesced into one more
+        read afterwards.
+        """
+        if self._walk_in_flight:
+            self._walk_pending = bool(self._walk_pending) or force
+            return
+        self._walk_in_flight = True
+        output_folder = get_output_folder(self.config)
+        threading.Thread(target=self._walk_worker, args=(output_folder, force), daemon=True).start()
+
+    def _walk_worker(self, output_folder: str, force: bool):
+        """Background thread: list the markdown files, then hand them to the UI thread."""
+        try:
+            files, rel_lower = self._list_files(output_folder, force)
+        except Exception:
+            logger.exception("Could not list saved posts in %s", output_folder)
+            files, rel_lower = [], []
+        self.after(0, lambda: self._on_walk_done(files, rel_lower))
+
+    def _on_walk_done(self, files: list, rel_lower: list):
+        """UI thread: show the listed files and run a refresh requested meanwhile."""
+        self._walk_in_flight = False
+        self.all_files, self._rel_lower = files, rel_lower
         self._update_list_ui()
+        if self._walk_pending is not None:
+            force, self._walk_pending = self._walk_pending, None
+            self._refresh_list(force)
+
+    def _list_files(self, output_folder: str, force: bool = False) -> tuple[list, list]:
+        """Return the (relative, full) paths of the saved posts and their lower-cased relative paths.
+        
+        The folder is only walked again when its signature changed since the
+        last walk (or when force is set, as by the Refresh button).
+        """
+        if not os.path.isdir(output_folder):
+            return [], []
+        try:
+            signature = self._folder_signature(output_folder)
+        except OSError:
+            signature = None
+        cached = self._walk_cache.get(output_folder)
+        if not force and signature is not None and cached and cached[0] == signature:
+            return cached[1], cached[2]
+
+        # Show paths relative to the output folder, sorted
+        prefix_len = len(os.path.join(output_folder, ""))
+        files = sorted(
+            (full_path[prefix_len:], full_path) for full_path in _scan_md_files(output_folder)
+        )
+        rel_lower = [rel_path.lower() for rel_path, _ in files]
+        if signature is not None:
+            self._walk_cache[output_folder] = (signature, files, rel_lower)
+        return files, rel_lower
 
     def _update_list_ui(self):
         """Update the file list UI based on filter."""
-        # Clear existing buttons
-        for btn in self.file_buttons:
-            btn.destroy()
-        self.file_buttons.clear()
-        
+        # A direct update supersedes any pending debounced one
+        if self._filter_after_id:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+
+        # Nothing to do if the same files are shown for the same filter (the
+        # walk cache hands back the same list object while the folder is unchanged)
+        filter_text = self.file_filter_entry.get().lower()
+        if self._rendered and self._rendered[0] == filter_text and self._rendered[1] is self.all_files:
+            return
+        if self._rendered and self._rendered[0] != filter_text:
+            self._page_limit = self.PAGE_SIZE  # A new filter starts at the first page
+        self._rendered = (filter_text, self.all_files)
+
         # Toggle filter visibility
         if len(self.all_files) >= 3:
             self.file_filter_entry.grid()
         else:
             self.file_filter_entry.grid_remove()
-        
-        filter_text = self.file_filter_entry.get().lower()
+
         visible_files = []
         
-        for rel_path, full_path in self.all_files:
-            if filter_text and filter_text not in rel_path.lower():
+        for entry, rel_lower in zip(self.all_files, self._rel_lower):
+            if filter_text and filter_text not in rel_lower:
                 continue
-            visible_files.append((rel_path, full_path))
+            visible_files.append(entry)
 
         count_text = f"({len(visible_files)})"
         if len(visible_files) != len(self.all_files):
@@ -157,42 +273,77 @@ class BrowseFrame(ctk.CTkFrame):
         self.file_count_label.configure(text=count_text)
 
         if not visible_files:
-            placeholder = ctk.CTkLabel(
-                self.file_list,
+            self._placeholder_label.configure(
                 text="No files found." if self.all_files else "No saved posts found.\nScrape some posts first!",
-                text_color="gray",
             )
-            placeholder.grid(row=0, column=0, pady=20)
-            # Add to list so it gets destroyed on next refresh
-            self.file_buttons.append(placeholder)
+            self._placeholder_label.grid(row=0, column=0, pady=20)
         else:
-            for i, (rel_path, full_path) in enumerate(visible_files):
+            self._placeholder_label.grid_remove()
+
+        # Only render the first pages of a long list
+        hidden_count = len(visible_files) - self._page_limit
+        if hidden_count > 0:
+            visible_files = visible_files[:self._page_limit]
+            self._show_more_btn.configure(text=f"Show {min(hidden_count, self.PAGE_SIZE)} more…")
+            self._show_more_btn.grid(row=len(visible_files), column=0, sticky="ew", padx=2, pady=1)
+        else:
+            self._show_more_btn.grid_remove()
+
+        # Reuse the pooled buttons (creating more only when the list outgrows
+        # the pool) and hide the ones not needed
+        for i, (rel_path, full_path) in enumerate(visible_files):
+            command = lambda p=full_path, r=rel_path: self._preview_file(p, r)
+            if i < len(self.file_buttons):
+                btn = self.file_buttons[i]
+                btn.configure(text=rel_path, command=command)
+            else:
                 btn = ctk.CTkButton(
                     self.file_list,
                     text=rel_path,
-                    font=ctk.CTkFont(size=11),
+                    font=self._file_font,
                     anchor="w",
                     height=28,
                     fg_color="transparent",
                     text_color=("gray10", "gray90"),
                     hover_color=("gray80", "gray30"),
-                    command=lambda p=full_path, r=rel_path: self._preview_file(p, r),
+                    command=command,
                 )
-                btn.grid(row=i, column=0, sticky="ew", padx=2, pady=1)
                 self.file_buttons.append(btn)
+            # Button i always sits in row i: only grid the ones not shown yet
+            if i >= self._shown_buttons:
+                btn.grid(row=i, column=0, sticky="ew", padx=2, pady=1)
+        for btn in self.file_buttons[len(visible_files):self._shown_buttons]:
+            btn.grid_remove()
+        self._shown_buttons = len(visible_files)
 
-    def _on_filter_change(self, event=None):
-        """Handle filter text change."""
+    def _show_more(self):
+        """Render the next page of the file list."""
+        self._page_limit += self.PAGE_SIZE
+        self._rendered = None
         self._update_list_ui()
 
+    def _on_filter_change(self, event=None):
+        """Handle filter text change. Debounced: a burst of typing rebuilds the list once."""
+        if self._filter_after_id:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(120, self._update_list_ui)
+
     def _preview_file(self, filepath: str, display_name: str):
         """Show a markdown file's contents in the preview panel."""
+        try:
+            mtime = os.stat(filepath).st_mtime_ns
+        except OSError:
+            mtime = 0
+        if mtime and filepath == self._selected_file and mtime == self._selected_mtime:
+            return  # Already showing this version of the file
+
         self._selected_file = filepath
+        self._selected_mtime = 0
         self.preview_title.configure(text=display_name)
 
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = _read_md(filepath, mtime)
+            self._selected_mtime = mtime
         except Exception as e:
             content = f"Error reading file: {e}"
 
@@ -6,6 +6,7 @@ import threading
 import customtkinter as ctk
 import random
 import tkinter as tk
+from datetime import datetime
 
 from ..scraper import LinkedInScraper, PostPreview
 from ..parser import parse_post
@@ -455,6 +456,21 @@ class ScrapeFrame(ctk.CTkFrame):
             self._scraper = LinkedInScraper(state_dir)
         return self._scraper
 
+    def close_browser(self):
+        """Close the scraper's browser if it is idle (called on app exit).
+        
+        A busy scraper is left alone; its browser thread is a daemon and the
+        browser goes away with the process.
+        """
+        if self._scraper is None or not self._scraper_lock.acquire(blocking=False):
+            return
+        try:
+            self._scraper.close()
+        except Exception:
+            logger.exception("Error closing browser")
+        finally:
+            self._scraper_lock.release()
+
     def _start_login_pulse(self):
         """Start pulsing animation on login button."""
         if not self._pulse_animation_active:
@@ -928,29 +944,29 @@ class ScrapeFrame(ctk.CTkFrame):
                     def on_status(msg):
                         self._set_status(msg, "working")
 
-                    # Scraper returns everything up to start_index
-                    raw_posts = scraper.scrape_posts(
+                    # Scraper yields everything up to start_index, oldest first.
+                    # Parse as posts arrive (one reference time for the whole batch)
+                    # so only the parsed selection is kept, not every post's HTML.
+                    wanted = set(selected_indices)
+                    parsed_posts = []
+                    scraped = 0
+                    now = datetime.today()
+                    for raw in scraper.iter_posts(
                         url,
                         start_index=start_index,
                         max_posts=self.config.get("max_posts", 50),
                         on_status=on_status,
                         should_stop=lambda: self.stop_event.is_set(),
                         on_data_count=on_scrape_count
-                    )
+                    ):
+                        scraped += 1
+                        if raw.index in wanted:
+                            parsed_posts.append(parse_post(raw.html, raw.date_text, raw.element_id, today=now))
 
-                if self.stop_event.is_set() and not raw_posts:
+                if self.stop_event.is_set() and not scraped:
                      self._set_status("Scrape cancelled.", "warning")
                      return
 
-                self._set_status(f"Filtering and parsing {len(raw_posts)} posts...", "working")
-
-                # Filter and Parse
-                parsed_posts = []
-                for raw in raw_posts:
-                    if raw.index in selected_indices:
-                        post = parse_post(raw.html, raw.date_text, raw.element_id)
-                        parsed_posts.append(post)
-
                 if not parsed_posts:
                     self._set_status("No selected posts found in scrape result.", "warning")
                     return
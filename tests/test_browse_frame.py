@@ -0,0 +1,45 @@
+"""
+Unit tests for the Browse tab (ui/browse_frame.py) with stubbed widgets.
+"""
+import pytest
+import customtkinter as ctk
+from src.ui import browse_frame
+from src.ui.browse_frame import BrowseFrame
+
+
+@pytest.fixture
+def frame(mocker):
+    """A BrowseFrame built without a display: Tk widgets are replaced by mocks."""
+    fake_ctk = mocker.patch.object(browse_frame, "ctk")
+    fake_ctk.CTkButton.side_effect = lambda *args, **kwargs: mocker.MagicMock()
+    mocker.patch.object(ctk.CTkFrame, "__init__", return_value=None)
+    mocker.patch.object(BrowseFrame, "grid_rowconfigure")
+    mocker.patch.object(BrowseFrame, "grid_columnconfigure")
+    return BrowseFrame(None, {"output_folder": "posts"})
+
+
+class TestBrowseFrame:
+    """Tests for BrowseFrame."""
+
+    def test_init_builds_widgets(self, frame):
+        """Test that the frame can be constructed and starts with an empty list."""
+        assert frame.all_files == []
+        assert frame.file_buttons == []
+        assert frame._page_limit == BrowseFrame.PAGE_SIZE
+        assert frame._show_more_btn is not None
+
+    def test_update_list_ui_renders_one_page(self, frame):
+        """Test that a long list only gets buttons for the first page."""
+        frame.file_filter_entry.get.return_value = ""
+        frame.all_files = [(f"p/{i:03}.md", f"/out/p/{i:03}.md") for i in range(250)]
+        frame._rel_lower = [rel for rel, _ in frame.all_files]
+
+        frame._update_list_ui()
+
+        assert len(frame.file_buttons) == BrowseFrame.PAGE_SIZE
+        frame._show_more_btn.grid.assert_called_once()
+
+        frame._show_more()
+
+        assert len(frame.file_buttons) == 250
+        frame._show_more_btn.grid_remove.assert_called_once()
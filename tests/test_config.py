@@ -0,0 +1,97 @@
+"""
+Unit tests for config.py module.
+"""
+import json
+import os
+import pytest
+from src import config
+from src.config import load_config, save_config, invalidate_config_cache, DEFAULT_CONFIG
+
+
+@pytest.fixture
+def user_data_dir(temp_output_dir, monkeypatch):
+    """Redirect the user data directory to a temporary folder."""
+    monkeypatch.setattr(config, "get_user_data_dir", lambda: temp_output_dir)
+    invalidate_config_cache()
+    yield temp_output_dir
+    invalidate_config_cache()
+
+
+class TestSaveConfig:
+    """Tests for save_config function."""
+    
+    def test_save_config_writes_file(self, user_data_dir):
+        """Test that save_config creates the config file."""
+        save_config(DEFAULT_CONFIG)
+        
+        with open(config.get_config_path(), "r", encoding="utf-8") as f:
+            assert json.load(f) == DEFAULT_CONFIG
+    
+    def test_save_config_skips_unchanged(self, user_data_dir):
+        """Test that save_config does not rewrite an identical config file."""
+        save_config(DEFAULT_CONFIG)
+        config_path = config.get_config_path()
+        os.utime(config_path, (0, 0))
+        
+        save_config(dict(DEFAULT_CONFIG))
+        assert os.path.getmtime(config_path) == 0
+        
+        save_config({**DEFAULT_CONFIG, "max_posts": 10})
+        assert os.path.getmtime(config_path) != 0
+        assert load_config()["max_posts"] == 10
+
+
+class TestLoadConfig:
+    """Tests for load_config function."""
+    
+    def test_load_config_defaults_when_missing(self, user_data_dir):
+        """Test that load_config returns defaults when no file exists."""
+        assert load_config() == DEFAULT_CONFIG
+    
+    def test_load_config_uses_cache(self, user_data_dir):
+        """Test that load_config serves cached settings until invalidated."""
+        save_config({**DEFAULT_CONFIG, "max_posts": 10})
+        with open(config.get_config_path(), "w", encoding="utf-8") as f:
+            json.dump({"max_posts": 20}, f)
+        
+        assert load_config()["max_posts"] == 10
+        invalidate_config_cache()
+        assert load_config()["max_posts"] == 20
+    
+    def test_load_config_after_partial_save(self, user_data_dir):
+        """Test that settings saved without every key still load with the defaults."""
+        save_config({"max_posts": 10})
+        
+        cached = load_config()
+        invalidate_config_cache()
+        assert cached == load_config() == {**DEFAULT_CONFIG, "max_posts": 10}
+    
+    def test_load_config_returns_independent_copies(self, user_data_dir):
+        """Test that modifying a loaded config does not affect the cache."""
+        save_config(DEFAULT_CONFIG)
+        
+        loaded = load_config()
+        loaded["max_posts"] = 999
+        
+        assert load_config()["max_posts"] == DEFAULT_CONFIG["max_posts"]
+
+
+class TestGetOutputFolder:
+    """Tests for get_output_folder function."""
+    
+    def test_get_output_folder_follows_setting_changes(self, tmp_path):
+        """Test that the cached path is recomputed when output_folder changes."""
+        settings = {"output_folder": str(tmp_path / "a")}
+        assert config.get_output_folder(settings) == os.path.normpath(str(tmp_path / "a"))
+        
+        settings["output_folder"] = str(tmp_path / "b")
+        assert config.get_output_folder(settings) == os.path.normpath(str(tmp_path / "b"))
+    
+    def test_save_config_omits_resolved_path(self, user_data_dir):
+        """Test that the cached output path is not written to the config file."""
+        settings = dict(DEFAULT_CONFIG)
+        config.get_output_folder(settings)
+        save_config(settings)
+        
+        with open(config.get_config_path(), "r", encoding="utf-8") as f:
+            assert json.load(f) == DEFAULT_CONFIG
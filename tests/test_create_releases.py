@@ -2,10 +2,14 @@
 Tests for the create_releases.py script.
 """
 
+import json
+import subprocess
 import sys
 from pathlib import Path
 import importlib.util
 
+import pytest
+
 # Load the create_releases module directly from its file path without
 # modifying sys.path, to avoid affecting other tests' imports.
 _create_releases_path = Path(__file__).parent.parent / "scripts" / "create_releases.py"
@@ -15,6 +19,37 @@ sys.modules.setdefault("create_releases", _create_releases_module)
 assert _create_releases_spec is not None and _create_releases_spec.loader is not None
 _create_releases_spec.loader.exec_module(_create_releases_module)
 parse_changelog = _create_releases_module.parse_changelog
+create_github_release = _create_releases_module.create_github_release
+list_release_tags = _create_releases_module.list_release_tags
+create_git_tag = _create_releases_module.create_git_tag
+create_git_tags = _create_releases_module.create_git_tags
+list_version_tags = _create_releases_module.list_version_tags
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """Create a throwaway git repository with one commit and chdir into it."""
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(var, "Test User")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(var, "test@example.com")
+    monkeypatch.chdir(tmp_path)
+    subprocess.run(["git", "init", "-q"], check=True)
+    subprocess.run(["git", "commit", "-q", "--allow-empty", "-m", "initial"], check=True)
+    return tmp_path
+
+
+def _fake_response(mocker, status_code, headers=None, json_data=None, links=None):
+    """Build a minimal stand-in for requests.Response."""
+    response = mocker.Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.text = ""
+    response.json.return_value = json_data
+    response.links = links or {}
+    return response
+
+
 def test_parse_changelog_with_fixture(tmp_path):
     """Test parsing a CHANGELOG with multiple versions."""
     changelog_content = """# Changelog
@@ -147,3 +182,270 @@ def test_parse_changelog_version_ordering(tmp_path):
     assert versions[0][0] == "2.0.0"
     assert versions[1][0] == "1.5.0"
     assert versions[2][0] == "1.0.0"
+
+
+def test_create_github_release_uses_session(mocker):
+    """Test that create_github_release sends its requests through the given session."""
+    session = mocker.Mock()
+    session.request.side_effect = [
+        _fake_response(mocker, 404),
+        _fake_response(mocker, 201),
+    ]
+
+    assert create_github_release("owner", "repo", "1.0.0", "- Feature", "token", session=session)
+
+    methods = [call.args[0] for call in session.request.call_args_list]
+    assert methods == ["GET", "POST"]
+    payload = json.loads(session.request.call_args.kwargs["data"].decode("utf-8"))
+    assert payload["tag_name"] == "v1.0.0"
+    assert payload["body"].startswith("## 📝 What's New in v1.0.0")
+
+
+def test_list_release_tags_follows_pagination(mocker):
+    """Test that all pages of the releases listing are collected."""
+    session = mocker.Mock()
+    session.request.side_effect = [
+        _fake_response(
+            mocker, 200,
+            json_data=[{"tag_name": "v1.2.0"}, {"tag_name": "v1.1.0"}],
+            links={"next": {"url": "https://api.github.com/releases?page=2"}},
+        ),
+        _fake_response(mocker, 200, json_data=[{"tag_name": "v1.0.0"}]),
+    ]
+
+    assert list_release_tags("owner", "repo", session) == {"v1.2.0", "v1.1.0", "v1.0.0"}
+    assert session.request.call_args.args[1] == "https://api.github.com/releases?page=2"
+
+
+def test_create_github_release_skips_known_release(mocker):
+    """Test that a release listed in existing_releases is skipped without requests."""
+    session = mocker.Mock()
+
+    assert create_github_release(
+        "owner", "repo", "1.0.0", "- Feature", "token",
+        session=session, existing_releases={"v1.0.0"},
+    )
+    session.request.assert_not_called()
+
+
+def test_create_github_release_assume_new_skips_check(mocker):
+    """Test that a fresh tag goes straight to the POST and tolerates an existing release."""
+    session = mocker.Mock()
+    session.request.return_value = _fake_response(
+        mocker, 422,
+        json_data={"message": "Validation Failed", "errors": [{"resource": "Release", "code": "already_exists"}]},
+    )
+
+    assert create_github_release(
+        "owner", "repo", "1.0.0", "- Feature", "token",
+        session=session, assume_new=True,
+    )
+    methods = [call.args[0] for call in session.request.call_args_list]
+    assert methods == ["POST"]
+
+
+def test_create_github_release_reports_failed_post(mocker):
+    """Test that an error status from the POST is reported without raising."""
+    session = mocker.Mock()
+    response = _fake_response(mocker, 500)
+    response.text = "boom"
+    session.request.return_value = response
+    messages = []
+
+    assert not create_github_release(
+        "owner", "repo", "1.0.0", "- Feature", "token",
+        session=session, assume_new=True, log=messages.append,
+    )
+    assert messages == ["  Error creating GitHub release v1.0.0: HTTP 500", "  Response: boom"]
+    response.raise_for_status.assert_not_called()
+
+
+def test_create_github_release_backs_off_when_rate_limited(mocker):
+    """Test that a rate-limited request is retried after the Retry-After delay."""
+    sleep = mocker.patch.object(_create_releases_module.time, "sleep")
+    session = mocker.Mock()
+    session.request.side_effect = [
+        _fake_response(mocker, 403, {"Retry-After": "2"}),
+        _fake_response(mocker, 200),
+    ]
+
+    assert create_github_release("owner", "repo", "1.0.0", "- Feature", "token", session=session)
+
+    sleep.assert_called_once_with(2.0)
+    assert session.request.call_count == 2
+
+
+def test_parse_changelog_legacy_parser_matches(tmp_path):
+    """Test that the string tokenizer and the legacy regex parser agree."""
+    changelog_content = """# Changelog
+
+## [Unreleased]
+
+- Work in progress
+
+## [1.10.2] - 2026-03-01 (hotfix)
+
+- Fix
+
+## [1.2] - 2026-02-01
+
+- Not a valid version header
+
+## [1.0.0] - 2026-1-01
+
+- Not a valid date
+
+## [1.0.0] - 2026-01-01
+
+- Original stuff
+"""
+
+    changelog_file = tmp_path / "CHANGELOG.md"
+    changelog_file.write_text(changelog_content, encoding="utf-8")
+
+    versions = parse_changelog(str(changelog_file))
+
+    assert versions == parse_changelog(str(changelog_file), legacy=True)
+    assert [v[0] for v in versions] == ["1.10.2", "1.0.0"]
+    assert "Not a valid version header" in versions[0][2]
+
+
+def test_parse_changelog_parsers_ignore_non_ascii_digits(tmp_path):
+    """Test that both header parsers reject versions written with non-ASCII digits."""
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text(
+        "## [1.0.0] - 2024-01-01\n- Ok\n\n## [\u0661.0.0] - 2024-01-02\n- Arabic-Indic digit\n",
+        encoding="utf-8",
+    )
+
+    fast = parse_changelog(str(changelog))
+    legacy = parse_changelog(str(changelog), legacy=True)
+    assert [version for version, _, _ in fast] == ["1.0.0"]
+    assert legacy == fast
+
+
+def test_create_git_tag_uses_known_tags(git_repo):
+    """Test that tags are created once and known tags are not re-created."""
+    existing_tags = list_version_tags()
+    assert existing_tags == set()
+
+    assert create_git_tag("1.0.0", "Release v1.0.0", existing_tags)
+    assert existing_tags == {"v1.0.0"}
+    # Second call is answered from the set without touching git
+    assert create_git_tag("1.0.0", "Release v1.0.0", existing_tags)
+
+    assert list_version_tags() == {"v1.0.0"}
+    tag_type = subprocess.run(
+        ["git", "cat-file", "-t", "v1.0.0"], capture_output=True, text=True, check=True
+    ).stdout.strip()
+    assert tag_type == "tag"
+
+
+def test_create_git_tags_batch(git_repo):
+    """Test that several annotated tags are created in one batch."""
+    assert create_git_tags([
+        ("1.0.0", "Release v1.0.0\n\nFirst"),
+        ("1.1.0", "Release v1.1.0\n\nSecond"),
+    ])
+
+    assert list_version_tags() == {"v1.0.0", "v1.1.0"}
+    message = subprocess.run(
+        ["git", "tag", "-l", "--format=%(contents)", "v1.1.0"],
+        capture_output=True, text=True, check=True
+    ).stdout
+    assert message.strip() == "Release v1.1.0\n\nSecond"
+
+
+def test_parse_changelog_reparses_modified_file(tmp_path):
+    """Test that cached results are invalidated when the file changes."""
+    changelog_file = tmp_path / "CHANGELOG.md"
+    changelog_file.write_text("## [1.0.0] - 2026-01-01\n\n- First\n", encoding="utf-8")
+
+    first = parse_changelog(str(changelog_file))
+    assert parse_changelog(str(changelog_file)) == first
+
+    changelog_file.write_text(
+        "## [1.1.0] - 2026-02-01\n\n- Second\n\n## [1.0.0] - 2026-01-01\n\n- First\n",
+        encoding="utf-8",
+    )
+
+    assert [v[0] for v in parse_changelog(str(changelog_file))] == ["1.1.0", "1.0.0"]
+
+
+def test_parse_changelog_keeps_separators_inside_sections(tmp_path):
+    """Test that '---' rules inside a section do not end it early."""
+    changelog_content = """# Changelog
+
+## [1.1.0] - 2026-02-01
+
+- Before rule
+
+---
+
+- After rule
+
+## [1.0.0] - 2026-01-01
+
+- Original stuff
+
+---
+
+## AI Agent Instructions
+
+## [9.9.9] - 2099-01-01
+"""
+
+    changelog_file = tmp_path / "CHANGELOG.md"
+    changelog_file.write_text(changelog_content, encoding="utf-8")
+
+    versions = parse_changelog(str(changelog_file))
+
+    assert [v[0] for v in versions] == ["1.1.0", "1.0.0", "9.9.9"]
+    assert "After rule" in versions[0][2]
+    assert "AI Agent Instructions" not in versions[1][2]
+    # The closing rule is dropped, rules inside the section are kept
+    assert versions[1][2] == "- Original stuff"
+    assert "---" in versions[0][2]
+
+
+def test_parse_changelog_keeps_versions_after_end_marker(tmp_path):
+    """Test that the end marker only ends its section, not the scan."""
+    changelog_content = """# Changelog
+
+## [2.0.0] - 2026-03-01
+
+- Second
+
+## AI Agent Instructions
+
+Not part of any release.
+
+## [1.0.0] - 2026-01-01
+
+- First
+"""
+
+    changelog_file = tmp_path / "CHANGELOG.md"
+    changelog_file.write_text(changelog_content, encoding="utf-8")
+
+    versions = parse_changelog(str(changelog_file))
+
+    assert [v[0] for v in versions] == ["2.0.0", "1.0.0"]
+    assert versions[0][2] == "- Second"
+    assert versions[1][2] == "- First"
+
+
+def test_get_default_owner_repo_reads_git_config(git_repo, monkeypatch, mocker):
+    """Test that the origin remote is read from .git/config without running git."""
+    monkeypatch.delenv("GITHUB_REPOSITORY", raising=False)
+    subprocess.run(
+        ["git", "remote", "add", "origin", "git@github.com:someone/some-repo.git"], check=True
+    )
+    run = mocker.patch.object(_create_releases_module.subprocess, "run")
+    _create_releases_module._get_default_owner_repo.cache_clear()
+
+    try:
+        assert _create_releases_module._get_default_owner_repo() == ("someone", "some-repo")
+    finally:
+        _create_releases_module._get_default_owner_repo.cache_clear()
+    run.assert_not_called()
@@ -62,6 +62,13 @@ class TestParseRelativeDate:
         expected = datetime.today().strftime("%Y-%m-%d")
         assert result == expected
     
+    def test_parse_with_reference_time(self):
+        """Test that relative dates are computed from the given reference time."""
+        now = datetime(2024, 3, 1, 1, 0)
+        assert parse_relative_date("2h", today=now) == "2024-02-29"
+        assert parse_relative_date("just now", today=now) == "2024-03-01"
+        assert parse_relative_date("1w", today=now) == "2024-02-23"
+    
     def test_parse_invalid_format(self):
         """Test parsing invalid format returns today with warning."""
         result = parse_relative_date("invalid date")
@@ -98,6 +105,10 @@ class TestConvertEngagementNumber:
         """Test converting whitespace returns 0."""
         assert _convert_engagement_number("   ") == 0
 
+    def test_convert_number_with_label(self):
+        """Test that a trailing word is not mistaken for a K/M suffix."""
+        assert _convert_engagement_number("12 comments") == 12
+
 
 class TestParsePost:
     """Tests for parse_post function."""
@@ -127,12 +138,41 @@ class TestParsePost:
         assert post.comments == 7
         assert post.reposts == 3
     
+    def test_parse_post_engagement_uses_last_button_with_text(self):
+        """Test that duplicate engagement buttons resolve to the last one with text."""
+        html = """
+        <div>
+            <button aria-label="5 reactions">5</button>
+            <button aria-label="12 Reactions">12</button>
+            <button aria-label="Reactions"></button>
+            <button aria-label="Comment">1.2K</button>
+        </div>
+        """
+        post = parse_post(html)
+        assert post.reactions == 12
+        assert post.comments == 1200
+        assert post.reposts == 0
+    
     def test_parse_post_detects_media_type(self, sample_post_html):
         """Test that parse_post detects media type."""
         post = parse_post(sample_post_html)
         assert post.media_type == "Image"
         assert post.media_link == "https://example.com/image.jpg"
     
+    def test_parse_post_media_priority_and_content_fallback(self):
+        """Test media checks keep their priority order and content falls back to commentary."""
+        html = """
+        <div>
+            <div class="feed-shared-update-v2__commentary">Line one<br>Line two</div>
+            <div class="feed-shared-poll"><a href="https://example.com/poll">Poll</a></div>
+            <div class="media update-components-image"><a href="https://example.com/img">Img</a></div>
+        </div>
+        """
+        post = parse_post(html)
+        assert post.content == "Line one\nLine two"
+        assert post.media_type == "Image"
+        assert post.media_link == "https://example.com/img"
+    
     def test_parse_post_handles_missing_fields(self):
         """Test that parse_post handles missing fields gracefully."""
         minimal_html = "<div class='feed-shared-update-v2'></div>"
@@ -3,7 +3,7 @@ Unit tests for scraper.py module.
 """
 import pytest
 import time
-from src.scraper import LinkedInScraper, PostPreview
+from src.scraper import LinkedInScraper, PostPreview, _is_logged_in_url
 
 
 class TestBuildActivityUrl:
@@ -40,6 +40,22 @@ class TestBuildActivityUrl:
         assert result == activity_url
 
 
+    @pytest.mark.parametrize("profile_url, expected", [
+        ("https://www.linkedin.com/in/testuser/", "https://www.linkedin.com/in/testuser/recent-activity/all/"),
+        ("https://linkedin.com/in/testuser?trk=x", "https://linkedin.com/in/testuser/recent-activity/all/"),
+        ("testuser", "https://www.linkedin.com/in/testuser/recent-activity/all/"),
+        (
+            "https://www.linkedin.com/in/testuser/recent-activity/all",
+            "https://www.linkedin.com/in/testuser/recent-activity/all/",
+        ),
+    ])
+    def test_build_activity_url(self, profile_url, expected):
+        """Test _build_activity_url with the supported input formats."""
+        scraper = LinkedInScraper("test_browser_state")
+        
+        assert scraper._build_activity_url(profile_url) == expected
+
+
 class TestHumanDelay:
     """Tests for human-like delay functionality."""
     
@@ -139,3 +155,569 @@ class TestScraperInitialization:
 
 # (Removed TestScrapePostsLogic, which only tested a trivial comparison and did not
 # exercise LinkedInScraper.scrape_posts or any scraper logic.)
+
+
+class TestBlockHeavyAssets:
+    """Tests for the resource-blocking route handler."""
+    
+    @pytest.mark.parametrize("resource_type, aborted", [
+        ("image", True),
+        ("stylesheet", True),
+        ("font", True),
+        ("document", False),
+        ("script", False),
+        ("xhr", False),
+    ])
+    def test_block_heavy_assets(self, mocker, resource_type, aborted):
+        """Test that only heavy asset requests are aborted."""
+        scraper = LinkedInScraper("test_browser_state")
+        route = mocker.Mock()
+        route.request.resource_type = resource_type
+        
+        scraper._block_heavy_assets(route)
+        
+        assert route.abort.called == aborted
+        assert route.continue_.called != aborted
+
+
+class TestContextReuse:
+    """Tests for keeping the browser context open between calls."""
+    
+    @pytest.fixture
+    def playwright(self, mocker):
+        """Patch sync_playwright so no real browser is launched."""
+        sync_playwright = mocker.patch("src.scraper.sync_playwright")
+        chromium = sync_playwright.return_value.start.return_value.chromium
+        chromium.launch_persistent_context.return_value.pages[0].is_closed.return_value = False
+        return chromium
+    
+    def test_context_reused_for_same_mode(self, playwright):
+        """Test that repeated calls with the same options launch the browser once."""
+        scraper = LinkedInScraper("test_browser_state")
+        
+        scraper._ensure_context(headless=True, block_assets=True)
+        scraper._ensure_context(headless=True, block_assets=True)
+        
+        assert playwright.launch_persistent_context.call_count == 1
+    
+    def test_context_relaunched_for_other_mode(self, playwright):
+        """Test that switching to a headed browser relaunches the context."""
+        scraper = LinkedInScraper("test_browser_state")
+        
+        scraper._ensure_context(headless=True, block_assets=True)
+        scraper._ensure_context(headless=False)
+        
+        assert playwright.launch_persistent_context.call_count == 2
+        assert playwright.launch_persistent_context.call_args.kwargs["headless"] is False
+        assert playwright.launch_persistent_context.call_args.kwargs["viewport"] == scraper.WINDOW_VIEWPORT
+    
+    def test_close_shuts_down_io_pool(self, tmp_path):
+        """Test that close() stops the debug snapshot writer thread."""
+        scraper = LinkedInScraper(str(tmp_path))
+        pool = scraper._get_io_pool()
+        
+        scraper.close()
+        
+        assert scraper._io_pool is None
+        with pytest.raises(RuntimeError):
+            pool.submit(print)
+    
+    def test_headless_context_uses_exported_session(self, playwright, tmp_path):
+        """Test that headless runs start from state.json in a non-persistent browser."""
+        (tmp_path / "state.json").write_text("{}")
+        scraper = LinkedInScraper(str(tmp_path))
+        
+        scraper._ensure_context(headless=True, block_assets=True)
+        
+        playwright.launch_persistent_context.assert_not_called()
+        new_context = playwright.launch.return_value.new_context
+        assert new_context.call_args.kwargs["storage_state"] == str(tmp_path / "state.json")
+        
+        scraper.close()
+        playwright.launch.return_value.close.assert_called_once()
+    
+    def test_open_activity_feed_saves_refreshed_session(self, playwright, tmp_path, mocker):
+        """Test that a signed-in headless run writes its cookies back to state.json."""
+        (tmp_path / "state.json").write_text("{}")
+        scraper = LinkedInScraper(str(tmp_path))
+        mocker.patch.object(scraper, "_wait_for_selector")
+        context = playwright.launch.return_value.new_context.return_value
+        context.pages[0].url = "https://www.linkedin.com/in/testuser/recent-activity/all/"
+        
+        scraper._open_activity_feed("https://www.linkedin.com/in/testuser/recent-activity/all/")
+        
+        context.storage_state.assert_called_once_with(path=str(tmp_path / "state.json"))
+    
+    def test_open_activity_feed_falls_back_to_profile_when_session_expired(self, playwright, tmp_path, mocker):
+        """Test that a rejected exported session is dropped and the profile is tried."""
+        (tmp_path / "state.json").write_text("{}")
+        scraper = LinkedInScraper(str(tmp_path))
+        mocker.patch.object(scraper, "_wait_for_selector")
+        playwright.launch.return_value.new_context.return_value.pages[0].url = "https://www.linkedin.com/login"
+        profile = playwright.launch_persistent_context.return_value
+        profile.pages[0].url = "https://www.linkedin.com/in/testuser/recent-activity/all/"
+        
+        scraper._open_activity_feed("https://www.linkedin.com/in/testuser/recent-activity/all/")
+        
+        assert playwright.launch_persistent_context.call_count == 1
+        assert not (tmp_path / "state.json").exists()  # The stale export was removed
+        profile.storage_state.assert_called_once_with(path=str(tmp_path / "state.json"))
+    
+    def test_headless_context_without_export_uses_profile(self, playwright, tmp_path):
+        """Test that the persistent profile is used until a session is exported."""
+        scraper = LinkedInScraper(str(tmp_path))
+        
+        scraper._ensure_context(headless=True, block_assets=True)
+        
+        playwright.launch.assert_not_called()
+        assert playwright.launch_persistent_context.call_count == 1
+    
+    def test_image_decoding_disabled_only_when_blocking_assets(self, playwright):
+        """Test that the imagesEnabled flag is added only for asset-blocking launches."""
+        scraper = LinkedInScraper("test_browser_state")
+        
+        scraper._ensure_context(headless=True, block_assets=True)
+        blocked_args = playwright.launch_persistent_context.call_args.kwargs["args"]
+        scraper._ensure_context(headless=False)
+        visible_args = playwright.launch_persistent_context.call_args.kwargs["args"]
+        
+        assert "--blink-settings=imagesEnabled=false" in blocked_args
+        assert "--blink-settings=imagesEnabled=false" not in visible_args
+        assert "--disable-background-timer-throttling" in visible_args
+    
+    def test_calls_run_on_one_browser_thread(self):
+        """Test that browser calls from different threads share one thread."""
+        import threading
+        scraper = LinkedInScraper("test_browser_state")
+        seen = []
+        
+        def call():
+            seen.append(scraper._run_on_browser_thread(threading.get_ident))
+        
+        workers = [threading.Thread(target=call) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        
+        assert len(set(seen)) == 1
+        assert seen[0] == scraper._browser_thread.ident
+
+
+class TestScanPosts:
+    """Tests for collecting previews while the feed scrolls."""
+    
+    def test_scan_posts_drains_posts_during_scroll(self, mocker):
+        """Test that each scroll's new posts are collected once per URN, in page order."""
+        scraper = LinkedInScraper("test_browser_state")
+        mocker.patch.object(scraper, "_ensure_context")
+        mocker.patch.object(scraper, "_wait_for_selector")
+        mocker.patch.object(scraper, "_get_io_pool")
+        scraper._page = mocker.Mock()
+        scraper._page.url = "https://www.linkedin.com/in/testuser/recent-activity/all/"
+        
+        def post(n):
+            return {"dateText": f"{n}d", "headline": f"Post {n}", "elementId": f"urn:li:activity:{n}", "html": f"<div>{n}</div>"}
+        
+        batches = iter([[post(1), post(2)], [post(2), post(3)], [], []])
+        scraper._post_locator = mocker.Mock()
+        scraper._post_locator.evaluate_all.side_effect = lambda *args: next(batches)
+        
+        def scroll_feed(on_status=None, should_stop=None, on_scroll=None):
+            on_scroll(1)
+            on_scroll(2)
+        
+        mocker.patch.object(scraper, "_scroll_feed", side_effect=scroll_feed)
+        
+        previews = scraper.scan_posts("https://www.linkedin.com/in/testuser/")
+        
+        assert [(p.index, p.element_id) for p in previews] == [
+            (0, "urn:li:activity:1"), (1, "urn:li:activity:2"), (2, "urn:li:activity:3"),
+        ]
+        assert [p["html"] for p in scraper._last_scan] == ["<div>1</div>", "<div>2</div>", "<div>3</div>"]
+        scraper._get_io_pool.assert_not_called()  # No debug snapshot by default
+        # Posts already collected are skipped in the page rather than marked in it
+        seen = [call.args[1]["seen"] for call in scraper._post_locator.evaluate_all.call_args_list]
+        assert seen[:2] == [[], ["urn:li:activity:1", "urn:li:activity:2"]]
+
+
+class TestScrapeFromScanCache:
+    """Tests for serving scrape_posts from the last scan."""
+    
+    def test_scrape_posts_uses_last_scan(self, mocker):
+        """Test that a scrape after a scan of the same profile skips the browser."""
+        scraper = LinkedInScraper("test_browser_state")
+        scraper._last_scan_url = "https://www.linkedin.com/in/testuser/recent-activity/all/"
+        scraper._last_scan = [
+            {"html": f"<div>{i}</div>", "dateText": f"{i}d", "elementId": f"urn:li:activity:{i}"}
+            for i in range(5)
+        ]
+        load_feed = mocker.patch.object(scraper, "_load_feed")
+        
+        raw_posts = scraper.scrape_posts("https://www.linkedin.com/in/testuser/", start_index=2)
+        
+        load_feed.assert_not_called()
+        assert [raw.index for raw in raw_posts] == [2, 1, 0]
+        assert raw_posts[0].element_id == "urn:li:activity:2"
+    
+    def test_scrape_posts_rereads_scanned_posts_from_page(self, mocker):
+        """Test that posts still in the page are read again instead of using the scan snapshot."""
+        scraper = LinkedInScraper("test_browser_state")
+        scraper._last_scan_url = "https://www.linkedin.com/in/testuser/recent-activity/all/"
+        scraper._last_scan = [
+            {"html": f"<div>{i}</div>", "dateText": f"{i}d", "elementId": f"urn:li:activity:{i}"}
+            for i in range(3)
+        ]
+        scraper._post_locator = mocker.Mock()
+        scraper._post_locator.evaluate_all.side_effect = lambda script, args: (
+            None if args["urn"] == "urn:li:activity:0"
+            else {"html": "<div>fresh</div>", "dateText": "1d", "elementId": args["urn"]}
+        )
+        
+        raw_posts = scraper.scrape_posts("https://www.linkedin.com/in/testuser/", start_index=1)
+        
+        assert [raw.html for raw in raw_posts] == ["<div>fresh</div>", "<div>0</div>"]
+    
+    def test_scrape_posts_loads_feed_for_other_profile(self, mocker):
+        """Test that the scan cache is ignored for a different profile."""
+        scraper = LinkedInScraper("test_browser_state")
+        scraper._last_scan_url = "https://www.linkedin.com/in/someone-else/recent-activity/all/"
+        scraper._last_scan = [{"html": "", "dateText": "", "elementId": ""}]
+        load_feed = mocker.patch.object(scraper, "_load_feed", return_value=[])
+        
+        assert scraper.scrape_posts("https://www.linkedin.com/in/testuser/", start_index=0) == []
+        load_feed.assert_called_once()
+
+
+class TestIterPosts:
+    """Tests for streaming posts out of a loaded feed."""
+    
+    def test_iter_posts_pulls_posts_oldest_first(self, mocker):
+        """Test that posts are extracted one by one from start_index down, capped by max_posts."""
+        scraper = LinkedInScraper("test_browser_state")
+        mocker.patch.object(scraper, "_load_feed", return_value=list(range(10)))
+        extract_post = mocker.patch.object(
+            scraper, "_extract_post",
+            side_effect=lambda i: {"html": f"<div>{i}</div>", "dateText": "", "elementId": f"urn:{i}"},
+        )
+        
+        posts = scraper.iter_posts("testuser", start_index=6, max_posts=3)
+        assert extract_post.call_count == 0  # nothing pulled before iteration
+        
+        assert [raw.index for raw in posts] == [6, 5, 4]
+        assert [call.args[0] for call in extract_post.call_args_list] == [6, 5, 4]
+    
+    def test_iter_posts_clamps_to_loaded_posts(self, mocker):
+        """Test that a start_index beyond the loaded feed starts at the last loaded post."""
+        scraper = LinkedInScraper("test_browser_state")
+        mocker.patch.object(scraper, "_load_feed", return_value=[0, 1])
+        mocker.patch.object(
+            scraper, "_extract_post",
+            side_effect=lambda i: {"html": "", "dateText": "", "elementId": ""},
+        )
+        
+        assert [raw.index for raw in scraper.iter_posts("testuser", start_index=5, max_posts=0)] == [1, 0]
+    
+    def test_iter_posts_maps_indices_to_dom_positions(self, mocker):
+        """Test that duplicate-free post indices are translated to DOM positions."""
+        scraper = LinkedInScraper("test_browser_state")
+        mocker.patch.object(scraper, "_load_feed", return_value=[0, 2, 3])
+        extract_post = mocker.patch.object(
+            scraper, "_extract_post",
+            side_effect=lambda i: {"html": "", "dateText": "", "elementId": ""},
+        )
+        
+        assert [raw.index for raw in scraper.iter_posts("testuser", start_index=2)] == [2, 1, 0]
+        assert [call.args[0] for call in extract_post.call_args_list] == [3, 2, 0]
+
+
+class TestScrollFeed:
+    """Tests for _scroll_feed with a mocked page."""
+    
+    def test_scroll_feed_waits_in_page_and_stops_on_no_change(self, mocker):
+        """Test that each scroll is one in-page wait and unchanged heights end the loop."""
+        scraper = LinkedInScraper("test_browser_state")
+        scraper._page = mocker.Mock()
+        scraper._page.evaluate.return_value = 1000
+        sleep = mocker.patch("src.scraper.time.sleep")
+        
+        scraper._scroll_feed()
+        
+        # Initial height read + one scroll-and-wait per iteration
+        assert scraper._page.evaluate.call_count == 1 + scraper.MAX_NO_CHANGE
+        options = scraper._page.evaluate.call_args.args[1]
+        assert scraper.SCROLL_IDLE_MS[0] <= options["idleMs"] <= scraper.SCROLL_IDLE_MS[1]
+        sleep.assert_not_called()
+    
+    def test_scroll_feed_keeps_waiting_while_feed_request_loads(self, mocker):
+        """Test that a slow feed response does not end the scroll early."""
+        scraper = LinkedInScraper("test_browser_state")
+        scraper._page = mocker.Mock()
+        feed_request = mocker.Mock(url="https://www.linkedin.com/voyager/api/graphql?queryId=voyagerFeedDashProfileUpdates.abc")
+        # Height stays put for more than MAX_NO_CHANGE scrolls while the next
+        # page of posts is still loading, then grows once it arrives
+        stalled = scraper.MAX_NO_CHANGE + 2
+        heights = iter([1000] * (1 + stalled) + [2000] * 10)
+        
+        def evaluate(*args):
+            if scraper._page.evaluate.call_count == 2:
+                scraper._track_feed_request(feed_request)
+            if scraper._page.evaluate.call_count == 1 + stalled:
+                scraper._untrack_feed_request(feed_request)
+            return next(heights)
+        
+        scraper._page.evaluate.side_effect = evaluate
+        
+        scraper._scroll_feed()
+        
+        assert scraper._page.evaluate.call_count == 1 + stalled + 1 + scraper.MAX_NO_CHANGE
+    
+    def test_feed_request_tracking_ignores_other_requests(self, mocker):
+        """Test that only the activity feed API calls are tracked until they finish."""
+        scraper = LinkedInScraper("test_browser_state")
+        feed = mocker.Mock(url="https://www.linkedin.com/voyager/api/graphql?queryId=voyagerFeedDashProfileUpdates.abc")
+        other = mocker.Mock(url="https://www.linkedin.com/voyager/api/me")
+        
+        scraper._track_feed_request(feed)
+        scraper._track_feed_request(other)
+        assert scraper._feed_requests == {feed}
+        
+        scraper._untrack_feed_request(feed)
+        assert not scraper._feed_requests
+
+
+class TestVoyagerCapture:
+    """Tests for collecting previews from LinkedIn's feed API responses."""
+    
+    UPDATE = {
+        "metadata": {"backendUrn": "urn:li:activity:123"},
+        "actor": {"subDescription": {"text": "2d • ", "accessibilityText": "2 days ago"}},
+        "commentary": {"text": {"text": "  Hello world  "}},
+    }
+    
+    def _response(self, mocker, url, payload):
+        response = mocker.Mock()
+        response.url = url
+        response.json.return_value = payload
+        return response
+    
+    def test_capture_voyager_collects_updates(self, mocker):
+        """Test that feed updates are decoded once per URN and other entities skipped."""
+        scraper = LinkedInScraper("test_browser_state")
+        response = self._response(
+            mocker,
+            "https://www.linkedin.com/voyager/api/graphql?queryId=voyagerFeedDashProfileUpdates.abc",
+            {"included": [self.UPDATE, {"entityUrn": "urn:li:fsd_profile:x"}, self.UPDATE]},
+        )
+        
+        scraper._capture_voyager(response)
+        
+        assert scraper._voyager_previews() == [{
+            "dateText": "2 days ago",
+            "headline": "Hello world",
+            "elementId": "urn:li:activity:123",
+            "index": 0,
+            "html": "",
+        }]
+    
+    def test_capture_voyager_accepts_member_share_feed(self, mocker):
+        """Test that the member share feed GraphQL query is captured too."""
+        scraper = LinkedInScraper("test_browser_state")
+        response = self._response(
+            mocker,
+            "https://www.linkedin.com/voyager/api/graphql?queryId=voyagerFeedDashMemberShareFeed.abc",
+            {"included": [self.UPDATE]},
+        )
+        
+        scraper._capture_voyager(response)
+        
+        assert [p["elementId"] for p in scraper._voyager_previews()] == ["urn:li:activity:123"]
+    
+    def test_capture_voyager_ignores_other_responses(self, mocker):
+        """Test that unrelated responses are not parsed."""
+        scraper = LinkedInScraper("test_browser_state")
+        response = self._response(mocker, "https://www.linkedin.com/feed/", {})
+        
+        scraper._capture_voyager(response)
+        
+        response.json.assert_not_called()
+        assert scraper._voyager_previews() == []
+    
+    def test_scan_posts_matches_api_previews_by_urn(self, mocker, tmp_path):
+        """Test that API previews follow the page order, whatever order the responses came in."""
+        scraper = LinkedInScraper(str(tmp_path / "browser_state"))
+        mocker.patch.object(scraper, "_ensure_context")
+        mocker.patch.object(scraper, "_scroll_feed")
+        mocker.patch("src.scraper.time.sleep")
+        scraper._page = mocker.Mock()
+        scraper._page.url = "https://www.linkedin.com/in/testuser/recent-activity/all/"
+        batches = iter([[
+            {"dateText": "", "headline": f"DOM {n}", "elementId": f"urn:li:activity:{n}", "html": ""}
+            for n in (1, 2, 3)
+        ], []])
+        scraper._post_locator = mocker.Mock()
+        scraper._post_locator.evaluate_all.side_effect = lambda *args: next(batches)
+        scraper._ensure_context.side_effect = lambda **kwargs: scraper._voyager_posts.update({
+            f"urn:li:activity:{n}": {"dateText": f"{n}d", "headline": f"API {n}", "elementId": f"urn:li:activity:{n}"}
+            for n in (3, 1)  # Responses arrived out of page order; post 2 was never captured
+        })
+        
+        previews = scraper.scan_posts("https://www.linkedin.com/in/testuser/", capture_html=False)
+        
+        assert [(p.index, p.element_id, p.headline) for p in previews] == [
+            (0, "urn:li:activity:1", "API 1"),
+            (1, "urn:li:activity:2", "DOM 2"),
+            (2, "urn:li:activity:3", "API 3"),
+        ]
+
+
+class TestDebugHtml:
+    """Tests for the debug HTML snapshot writer."""
+    
+    def test_write_debug_html_creates_folder(self, tmp_path):
+        """Test that the snapshot is written, creating the debug folder."""
+        debug_file = tmp_path / "debug" / "linkedin_page.html"
+        
+        LinkedInScraper._write_debug_html("<html></html>", str(debug_file))
+        
+        assert debug_file.read_text(encoding="utf-8") == "<html></html>"
+
+
+class TestCheckProfileExists:
+    """Tests for the profile validity check."""
+    
+    @pytest.mark.parametrize("unavailable", [True, False])
+    def test_check_profile_exists_checks_page_in_browser(self, mocker, unavailable):
+        """Test that the 404 check runs in the page instead of fetching its HTML."""
+        scraper = LinkedInScraper("test_browser_state")
+        mocker.patch.object(scraper, "_ensure_context")
+        scraper._page = mocker.Mock()
+        scraper._page.url = "https://www.linkedin.com/in/testuser/"
+        scraper._page.evaluate.return_value = unavailable
+        
+        assert scraper.check_profile_exists("https://www.linkedin.com/in/testuser/") is not unavailable
+        scraper._page.content.assert_not_called()
+
+
+class TestExtractProfileUrl:
+    """Tests for reading the member's profile URL after login."""
+    
+    def test_extract_profile_url_after_redirect(self, mocker):
+        """Test that the profile URL is taken once the redirect has landed."""
+        scraper = LinkedInScraper("test_browser_state")
+        scraper._page = mocker.Mock()
+        scraper._page.url = "https://www.linkedin.com/in/jane-doe/?miniProfileUrn=x"
+        
+        assert scraper._extract_profile_url() == "https://www.linkedin.com/in/jane-doe/"
+        predicate = scraper._page.wait_for_url.call_args.args[0]
+        assert not predicate("https://www.linkedin.com/in/")
+    
+    def test_extract_profile_url_returns_none_without_redirect(self, mocker):
+        """Test that a redirect that never comes yields None instead of raising."""
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        scraper = LinkedInScraper("test_browser_state")
+        scraper._page = mocker.Mock()
+        scraper._page.wait_for_url.side_effect = PlaywrightTimeoutError("timeout")
+        
+        assert scraper._extract_profile_url() is None
+
+
+class TestCheckProfiles:
+    """Tests for checking several profiles concurrently."""
+    
+    def _patch_browser(self, mocker, contexts):
+        """Replace async Playwright by a browser whose contexts are appended to contexts."""
+        async def new_context(**kwargs):
+            context = mocker.AsyncMock()
+            context.kwargs = kwargs
+            contexts.append(context)
+            page = mocker.AsyncMock()
+            page.evaluate.return_value = False
+            
+            async def goto(url, **kwargs):
+                page.url = "https://www.linkedin.com/404/" if "missing" in url else url
+            
+            page.goto.side_effect = goto
+            context.new_page.return_value = page
+            return context
+        
+        browser = mocker.AsyncMock()
+        browser.new_context.side_effect = new_context
+        playwright = mocker.MagicMock()
+        playwright.chromium.launch = mocker.AsyncMock(return_value=browser)
+        manager = mocker.MagicMock()
+        manager.__aenter__ = mocker.AsyncMock(return_value=playwright)
+        manager.__aexit__ = mocker.AsyncMock(return_value=False)
+        mocker.patch("src.scraper.async_playwright", return_value=manager)
+        return browser
+    
+    def test_check_profiles_reports_each_url(self, mocker):
+        """Test that every URL gets its own context and result."""
+        scraper = LinkedInScraper("test_browser_state")
+        mocker.patch.object(scraper, "_export_storage_state", return_value={"cookies": []})
+        contexts = []
+        browser = self._patch_browser(mocker, contexts)
+        
+        results = scraper.check_profiles([
+            "https://www.linkedin.com/in/present/",
+            "https://www.linkedin.com/in/missing/",
+        ])
+        
+        assert results == {
+            "https://www.linkedin.com/in/present/": True,
+            "https://www.linkedin.com/in/missing/": False,
+        }
+        assert all(c.kwargs["storage_state"] == {"cookies": []} for c in contexts)
+        assert all(c.close.await_count == 1 for c in contexts)
+        browser.close.assert_awaited_once()
+    
+    def test_check_profiles_keeps_other_results_on_error(self, mocker):
+        """Test that one failing profile is reported as False without losing the rest."""
+        scraper = LinkedInScraper("test_browser_state")
+        mocker.patch.object(scraper, "_export_storage_state", return_value={"cookies": []})
+        self._patch_browser(mocker, [])
+        
+        async def check(context, url):
+            if "broken" in url:
+                raise RuntimeError("context crashed")
+            return True
+        
+        mocker.patch.object(scraper, "_check_in_context", side_effect=check)
+        
+        results = scraper.check_profiles([
+            "https://www.linkedin.com/in/present/",
+            "https://www.linkedin.com/in/broken/",
+        ])
+        
+        assert results == {
+            "https://www.linkedin.com/in/present/": True,
+            "https://www.linkedin.com/in/broken/": False,
+        }
+
+
+class TestWaitForSelector:
+    """Tests for the post-navigation readiness wait."""
+    
+    def test_wait_for_selector_returns_false_on_timeout(self, mocker):
+        """Test that a timeout is reported instead of raised."""
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        scraper = LinkedInScraper("test_browser_state")
+        scraper._page = mocker.Mock()
+        scraper._page.wait_for_selector.side_effect = PlaywrightTimeoutError("timeout")
+        
+        assert scraper._wait_for_selector("div", timeout=10) is False
+
+
+@pytest.mark.parametrize("url,expected", [
+    ("https://www.linkedin.com/feed/", True),
+    ("https://www.linkedin.com/mynetwork/grow/", True),
+    ("https://www.linkedin.com/feed/?login=0", True),
+    ("https://www.linkedin.com/login?session_redirect=%2Ffeed%2F", False),
+    ("https://www.linkedin.com/uas/login?from=feed", False),
+    ("https://www.linkedin.com/authwall?trk=feed", False),
+    ("https://www.linkedin.com/feed-notifications-redirect", False),
+    ("https://www.linkedin.com/mynetworkx/", False),
+])
+def test_is_logged_in_url(url, expected):
+    """Test that only the URL path decides whether a page is signed in."""
+    assert _is_logged_in_url(url) is expected
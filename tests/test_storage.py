@@ -5,7 +5,7 @@ import pytest
 import os
 from pathlib import Path
 from datetime import datetime
-from src.storage import save_post, get_latest_post_date
+from src.storage import save_post, save_posts, get_latest_post_date, _index_folder, _make_slug
 from src.parser import Post
 
 
@@ -90,6 +90,92 @@ class TestSavePost:
         assert len(files) == 1
 
 
+class TestSavePosts:
+    """Tests for save_posts function."""
+    
+    def test_save_posts_skips_existing_and_repeated_urls(self, temp_output_dir):
+        """Test that posts already on disk or earlier in the batch are skipped."""
+        save_post(Post(author="Author", date="2024-01-01", content="Old", post_url="https://linkedin.com/post/1"), temp_output_dir)
+        posts = [
+            Post(author="Author", date="2024-01-01", content="Old", post_url="https://linkedin.com/post/1"),
+            Post(author="Author", date="2024-02-01", content="New", post_url="https://linkedin.com/post/2"),
+            Post(author="Author", date="2024-02-01", content="New", post_url="https://linkedin.com/post/2"),
+        ]
+        
+        saved = save_posts(posts, temp_output_dir)
+        
+        assert len(saved) == 1
+        assert len(list(Path(temp_output_dir).rglob("*.md"))) == 2
+    
+    def test_save_posts_keeps_colliding_filenames_apart(self, temp_output_dir):
+        """Test that posts written in parallel with the same filename all get their own file."""
+        posts = [
+            Post(author="Author", date="2024-02-01", content="Same", post_url=f"https://linkedin.com/post/{i}")
+            for i in range(8)
+        ]
+        progress = []
+        
+        saved = save_posts(posts, temp_output_dir, on_progress=lambda i, total, path: progress.append(i))
+        
+        assert len(set(saved)) == 8
+        assert len(list(Path(temp_output_dir).rglob("*.md"))) == 8
+        assert list(Path(temp_output_dir).rglob("*.tmp")) == []  # Temporary files are renamed into place
+        assert progress == list(range(1, 9))
+    
+    def test_save_posts_numbers_collisions_in_input_order(self, temp_output_dir):
+        """Test that colliding posts get their suffix by position, not by write order."""
+        posts = [
+            Post(author="Author", date="2024-02-01", content=f"Same\nPost {i}", post_url=f"https://linkedin.com/post/{i}")
+            for i in range(6)
+        ]
+        
+        saved = save_posts(posts, temp_output_dir)
+        
+        assert [Path(path).name for path in saved] == ["2024-02-01_same.md"] + [
+            f"2024-02-01_same_{i}.md" for i in range(1, 6)
+        ]
+        assert all(f"Post {i}" in Path(path).read_text(encoding="utf-8") for i, path in enumerate(saved))
+    
+    def test_save_posts_accepts_generator(self, temp_output_dir, monkeypatch):
+        """Test that a generator is saved in order with an unknown total."""
+        monkeypatch.setattr("src.storage._SAVE_WORKERS", 1)
+        posts = (
+            Post(author="Author", date="2024-02-01", content=f"Post {i}", post_url=f"https://linkedin.com/post/{i}")
+            for i in range(5)
+        )
+        totals = []
+        
+        saved = save_posts(posts, temp_output_dir, on_progress=lambda i, total, path: totals.append(total))
+        
+        assert [Path(path).name for path in saved] == [f"2024-02-01_post-{i}.md" for i in range(5)]
+        assert totals == [None] * 5
+    
+    def test_index_folder_reads_sources_and_filenames(self, temp_output_dir):
+        """Test that the index holds each saved post's source URL and file name."""
+        save_post(Post(author="Author", date="2024-01-01", content="A", post_url="https://linkedin.com/post/1"), temp_output_dir)
+        save_post(Post(author="Author", date="2024-01-02", content="B"), temp_output_dir)
+        
+        person_folder = os.path.join(temp_output_dir, "author")
+        urls, filenames = _index_folder(person_folder)
+        
+        assert urls == {"https://linkedin.com/post/1"}
+        assert filenames == {"2024-01-01_a.md", "2024-01-02_b.md"}
+
+
+@pytest.mark.parametrize("text", [
+    "This is a Test Post",
+    "  -- Leading and trailing --  ",
+    "Multiple   spaces - and -- dashes",
+    "A very long first line that goes on well past the fifty character limit",
+    "Ünïcödé and punctuation!",
+    "---",
+])
+def test_make_slug_matches_slugify(text):
+    """Test that the plain-ASCII fast path gives the same slug as slugify."""
+    from slugify import slugify
+    expected = slugify(text.strip()[:50], max_length=50) or "post"
+    assert _make_slug(text + "\nsecond line") == expected
+
 
 class TestGetLatestPostDate:
     """Tests for get_latest_post_date function."""